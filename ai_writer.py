@@ -6,24 +6,37 @@ Analyzes news articles, drafts letters in Brian West's progressive voice,
 and outputs JSON files for the mailer PDF generation system
 """
 
+import io
+import atexit
 import os
+import re
 import sys
+import threading
 import time
 import json
-import tempfile
-import subprocess
+import hashlib
+import functools
+import shutil
 import platform
 import logging
-import requests
-import trafilatura
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-from bs4 import BeautifulSoup
-from newspaper import Article
-from openai import OpenAI
+from typing import Callable, List, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 
+# Article fetching (requests, newspaper3k, trafilatura, bs4) and OpenAI imports
+# are deferred to the classes that use them; newspaper3k alone pulls in NLTK.
+# subprocess and tempfile are only needed once the visual editor is opened (tempfile
+# also for article cache writes), and tiktoken only once text is first truncated to
+# a token budget.
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -38,139 +51,445 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Platform checked once rather than on every screen clear
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# Cursor home, clear screen and scrollback: what `clear` emits on ANSI terminals
+_ANSI_CLEAR = '\x1b[H\x1b[2J\x1b[3J'
+
+# Recipient office types by level of government
+_FEDERAL_TYPES = frozenset({'federal_senate', 'federal_house'})
+_STATE_TYPES = frozenset({'state_senate', 'state_house', 'governor'})
+
+# Runs of whitespace collapsed when extracting plain text from HTML
+_WS_RE = re.compile(r'\s+')
+
+
+# Rough characters per token of English text, used when tiktoken is unavailable
+_CHARS_PER_TOKEN = 4
+
+
+# Serializes the first lookup, so concurrent fetch threads don't each download the encoding
+_token_encoding_lock = threading.Lock()
+
+
+def _token_encoding(model: Optional[str]):
+    """Return the tiktoken encoding for a model, or None without tiktoken or when it can't be loaded"""
+    with _token_encoding_lock:
+        return _load_token_encoding(model)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_token_encoding(model: Optional[str]):
+    """Load a tiktoken encoding; failures are cached too, so each is logged once and not retried"""
+    try:
+        import tiktoken
+    except ImportError:  # Fall back to an approximate characters-per-token budget
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding('cl100k_base')
+        except KeyError:
+            return tiktoken.get_encoding('cl100k_base')
+    except Exception as e:  # get_encoding downloads its data on first use, which can fail offline
+        logger.warning(f"Could not load tiktoken encoding, approximating token counts: {e}")
+        return None
+
+
+def _truncate_to_tokens(text: str, max_tokens: int, model: Optional[str] = None) -> str:
+    """Trim text to at most max_tokens tokens, as counted by the model's tokenizer"""
+    encoding = _token_encoding(model)
+    if encoding is None:
+        return text[:max_tokens * _CHARS_PER_TOKEN]
+
+    tokens = encoding.encode(text, disallowed_special=())
+    return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+
+
+def _json_loads(data):
+    """Parse JSON text, using orjson when it is installed"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+# Stdlib encoders for when orjson is missing, built once rather than on every json.dumps call
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+_JSON_LINE_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return _JSON_ENCODER.encode(obj).encode('utf-8')
+
+
+def _json_line(obj) -> bytes:
+    """Serialize to one compact, newline-terminated line of UTF-8 JSON (for JSONL logs)"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (_JSON_LINE_ENCODER.encode(obj) + '\n').encode('utf-8')
+
+
+def _write_bytes(path: Union[str, Path], payload: bytes):
+    """Write an encoded payload to a file with raw os.write calls, bypassing file-object buffering"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _replace_bytes(path: Union[str, Path], payload: bytes):
+    """Write a payload to a temporary sibling file, then atomically swap it into place"""
+    # No fsync: session files are low-durability, so the page cache absorbs the write
+    tmp_path = f"{path}.tmp"
+    _write_bytes(tmp_path, payload)
+    os.replace(tmp_path, path)
+
+
+def _results_in_order(executor: ThreadPoolExecutor, futures: list) -> list:
+    """
+    Collect future results in submission order, then shut the executor down.
+    On an error or Ctrl-C, tasks that haven't started are cancelled and the executor
+    isn't waited on, so the exception surfaces before the queued work (e.g. paid API calls) runs.
+    """
+    try:
+        results = [future.result() for future in futures]
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+        raise
+    executor.shutdown()
+    return results
+
+
+# ==================== CONFIG FILES ====================
+
+# path -> (mtime, contents) for config files that are static during a run
+_config_file_cache: Dict[str, Tuple[float, object]] = {}
+
+
+def _read_config_file(path: str, parse=None):
+    """Read (and optionally parse) a config file, re-reading only when it changes on disk"""
+    mtime = os.path.getmtime(path)
+    cached = _config_file_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, 'r', encoding='utf-8') as f:
+        contents = f.read()
+    if parse:
+        contents = parse(contents)
+
+    _config_file_cache[path] = (mtime, contents)
+    return contents
+
 
 # ==================== NEWS ARTICLE FETCHER ====================
 
 class NewsArticleFetcher:
     """Fetches and extracts content from news articles"""
 
+    # Maximum number of articles fetched concurrently
+    MAX_WORKERS = 10
+
+    # Published articles rarely change, so fetched content is cached on disk
+    CACHE_DIR = Path('.article_cache')
+    CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+
     def __init__(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
 
+        # Reuse connections to the same news sites and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET']
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def fetch_article(self, url: str) -> Dict[str, str]:
-        """Fetch and extract article content from a URL"""
+        """Fetch and extract article content from a URL, using the disk cache when fresh"""
+        cached = self._load_cached_article(url)
+        if cached:
+            logger.info(f"Using cached article for: {url}")
+            return cached
+
         try:
             logger.info(f"Fetching article from: {url}")
+            article = self._download_article(url)
+        except Exception as e:
+            logger.error(f"Error fetching article from {url}: {e}")
+            return {
+                'url': url,
+                'title': 'Error fetching article',
+                'text': f'Could not fetch article: {str(e)}',
+                'authors': 'Unknown',
+                'publish_date': 'Unknown',
+                'summary': '',
+                'source': self._extract_source(url)
+            }
 
-            # Method 1: Try newspaper3k first
-            try:
-                article = Article(url)
-                article.download()
-                article.parse()
-
-                if article.text:
-                    return {
-                        'url': url,
-                        'title': article.title or 'Untitled',
-                        'text': article.text,
-                        'authors': ', '.join(article.authors) if article.authors else 'Unknown',
-                        'publish_date': str(article.publish_date) if article.publish_date else 'Unknown',
-                        'summary': article.summary if hasattr(article, 'summary') else '',
-                        'source': self._extract_source(url)
-                    }
-            except:
-                pass
-
-            # Method 2: Fallback to trafilatura
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+        self._store_cached_article(url, article)
+        return article
 
-            extracted = trafilatura.extract(
-                response.text,
-                include_comments=False,
-                include_tables=False,
-                deduplicate=True
-            )
+    def _cache_path(self, url: str) -> Path:
+        """Path of the cache entry for a URL"""
+        return self.CACHE_DIR / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
 
-            if extracted:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                title = soup.find('title').text.strip() if soup.find('title') else 'Untitled'
+    def _load_cached_article(self, url: str) -> Optional[Dict[str, str]]:
+        """Return the cached article for a URL, or None if missing or expired"""
+        cache_file = self._cache_path(url)
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.CACHE_TTL:
+                return None
+            with open(cache_file, 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _store_cached_article(self, url: str, article: Dict[str, str]):
+        """Write a fetched article to the disk cache"""
+        import tempfile
+
+        # Fetch threads can store the same URL at once, so each writes its own temp
+        # file and atomically swaps it in; readers never see a partial entry
+        tmp_path = None
+        try:
+            self.CACHE_DIR.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.CACHE_DIR, suffix='.tmp')
+            os.close(fd)
+            _write_bytes(tmp_path, _json_dumps(article))
+            os.replace(tmp_path, self._cache_path(url))
+        except OSError as e:
+            logger.warning(f"Could not cache article from {url}: {e}")
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _download_article(self, url: str) -> Dict[str, str]:
+        """Download and extract article content, trying each extraction method in turn"""
+        import trafilatura
+        from bs4 import BeautifulSoup, SoupStrainer
+        from newspaper import Article
+
+        # Download once through the pooled session; every method parses this HTML
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        html = response.text
+
+        # Method 1: Try newspaper3k first
+        try:
+            article = Article(url)
+            article.set_html(html)
+            article.parse()
 
+            if article.text:
                 return {
                     'url': url,
-                    'title': title,
-                    'text': extracted,
-                    'authors': 'Unknown',
-                    'publish_date': 'Unknown',
-                    'summary': extracted[:500] + '...' if len(extracted) > 500 else extracted,
+                    'title': article.title or 'Untitled',
+                    'text': article.text,
+                    'authors': ', '.join(article.authors) if article.authors else 'Unknown',
+                    'publish_date': str(article.publish_date) if article.publish_date else 'Unknown',
+                    'summary': article.summary if hasattr(article, 'summary') else '',
                     'source': self._extract_source(url)
                 }
+        except:
+            pass
+
+        # Method 2: Fallback to trafilatura
+        extracted = trafilatura.extract(
+            html,
+            include_comments=False,
+            include_tables=False,
+            deduplicate=True
+        )
 
-            # Method 3: Basic HTML extraction
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Remove script and style elements
-            for element in soup(['script', 'style']):
-                element.decompose()
-
-            # Get text
-            text = soup.get_text()
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = ' '.join(chunk for chunk in chunks if chunk)
-
-            title = soup.find('title').text.strip() if soup.find('title') else 'Untitled'
+        if extracted:
+            # Only the <title> element is needed here, so skip building the rest of the tree
+            soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('title'))
 
             return {
                 'url': url,
-                'title': title,
-                'text': text[:5000],  # Limit to first 5000 chars
+                'title': self._page_title(soup),
+                'text': extracted,
                 'authors': 'Unknown',
                 'publish_date': 'Unknown',
-                'summary': text[:500] + '...' if len(text) > 500 else text,
+                'summary': extracted[:500] + '...' if len(extracted) > 500 else extracted,
                 'source': self._extract_source(url)
             }
 
-        except Exception as e:
-            logger.error(f"Error fetching article from {url}: {e}")
-            return {
-                'url': url,
-                'title': 'Error fetching article',
-                'text': f'Could not fetch article: {str(e)}',
-                'authors': 'Unknown',
-                'publish_date': 'Unknown',
-                'summary': '',
-                'source': self._extract_source(url)
-            }
+        # Method 3: Basic HTML extraction
+        soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer(['title', 'body']))
+        title = self._page_title(soup)
+
+        # Remove script and style elements
+        for element in soup(['script', 'style']):
+            element.decompose()
+
+        # Get text with whitespace runs collapsed to single spaces
+        text = _WS_RE.sub(' ', soup.get_text(separator=' ', strip=True)).strip()
 
-    def _extract_source(self, url: str) -> str:
+        return {
+            'url': url,
+            'title': title,
+            'text': _truncate_to_tokens(text, 2000),  # Limit to first 2000 tokens
+            'authors': 'Unknown',
+            'publish_date': 'Unknown',
+            'summary': text[:500] + '...' if len(text) > 500 else text,
+            'source': self._extract_source(url)
+        }
+
+    @staticmethod
+    def _page_title(soup) -> str:
+        """Return the page <title> text, looking the tag up only once"""
+        title_tag = soup.find('title')
+        return title_tag.text.strip() if title_tag else 'Untitled'
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _extract_source(url: str) -> str:
         """Extract source domain from URL"""
         try:
-            from urllib.parse import urlparse
             domain = urlparse(url).netloc
             return domain.replace('www.', '')
         except:
             return 'Unknown'
 
     def fetch_multiple_articles(self, urls: List[str]) -> List[Dict[str, str]]:
-        """Fetch multiple articles"""
-        articles = []
-        for url in urls:
-            article = self.fetch_article(url)
-            articles.append(article)
-        return articles
+        """Fetch multiple articles concurrently, preserving the order of urls"""
+        if not urls:
+            return []
+
+        # Fetching is network-bound, so threads overlap the per-article latency
+        executor = ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(urls)))
+        return _results_in_order(executor, [executor.submit(self.fetch_article, url) for url in urls])
 
 
 # ==================== AI LETTER DRAFTER ====================
 
+# Static prompt text, defined once so it is byte-identical across requests
+
+_ANALYSIS_PROMPT_HEADER = """Acting as an expert policy analyst helping constituents communicate with their representatives, analyze the news articles below and extract the key policy issues, concerns, and actionable points relevant to a U.S. Senator.
+
+Please provide:
+1. Main issue(s) discussed
+2. How this affects Oklahoma constituents
+3. Specific policy implications
+4. Recommended actions for the Senator
+5. Key facts and statistics mentioned
+
+Articles:
+"""
+
+_LETTER_RESPONSE_FORMAT = """Format your response as:
+SUBJECT: [subject line here]
+LETTER:
+[letter content here]"""
+
+_PERSONALIZED_RESPONSE_FORMAT = """Return the personalized letter with format:
+SUBJECT: [new subject line variation]
+LETTER:
+[personalized letter content]"""
+
+
 class AILetterDrafter:
     """Uses OpenAI to draft letters based on news context"""
 
+    # Responses to deterministic (temperature 0) requests are cached on disk
+    CACHE_DIR = Path('.llm_cache')
+
+    # Default maximum number of personalization requests in flight at once,
+    # and the most OPENAI_MAX_CONCURRENCY may raise it to
+    MAX_PERSONALIZE_WORKERS = 8
+    MAX_CONCURRENCY_LIMIT = 32
+
+    # Personalization approaches, rotated by variation index
+    _APPROACH_VARIATIONS = (
+        "Lead with personal impact and constituent stories",
+        "Emphasize data and statistical evidence",
+        "Focus on constitutional and legal precedents",
+        "Highlight economic implications",
+        "Stress moral and ethical considerations",
+        "Connect to historical context and past policies"
+    )
+
+    # Calls to action, rotated by variation index
+    _ACTION_VARIATIONS = (
+        "Request a town hall or public meeting",
+        "Ask for specific legislative action or vote",
+        "Request a written response addressing concerns",
+        "Propose specific policy solutions",
+        "Ask for committee consideration or hearings",
+        "Request collaboration with other officials"
+    )
+
     def __init__(self, api_key: Optional[str] = None):
+        import httpx
+        from openai import OpenAI
+
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         if not self.api_key:
             raise ValueError("OpenAI API key not provided. Set OPENAI_API_KEY in .env file")
 
-        self.client = OpenAI(api_key=self.api_key)
+        # Concurrent personalization requests, lowered for accounts with tight rate limits
+        try:
+            self.max_concurrency = max(1, int(os.getenv('OPENAI_MAX_CONCURRENCY') or self.MAX_PERSONALIZE_WORKERS))
+        except ValueError:
+            logger.warning("Ignoring invalid OPENAI_MAX_CONCURRENCY, expected a whole number")
+            self.max_concurrency = self.MAX_PERSONALIZE_WORKERS
+        if self.max_concurrency > self.MAX_CONCURRENCY_LIMIT:
+            logger.warning(f"OPENAI_MAX_CONCURRENCY capped at {self.MAX_CONCURRENCY_LIMIT}")
+            self.max_concurrency = self.MAX_CONCURRENCY_LIMIT
+
+        # Long-lived client: its keep-alive pool is reused by every request, and is
+        # sized so each concurrent personalization call gets its own connection
+        # (otherwise extra workers wait on the pool and can time out)
+        pool_size = max(16, self.max_concurrency)
+        self.client = OpenAI(
+            api_key=self.api_key,
+            max_retries=3,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            )
+        )
         self.model = os.getenv('OPENAI_MODEL', 'gpt-4-turbo-preview')  # Default to GPT-4 Turbo
         logger.info(f"Using OpenAI model: {self.model}")
 
+        # Replay mode: force temperature 0 and a fixed seed so every response can be cached
+        self.deterministic = os.getenv('OPENAI_DETERMINISTIC', '').lower() in ('1', 'true', 'yes')
+        if self.deterministic:
+            logger.info("Deterministic mode enabled, AI responses will be cached")
+
         # Load custom system prompt if available
         self.system_prompt = self._load_system_prompt()
 
+        # Every request shares the system prompt as its prefix; keying on it
+        # routes requests to the same OpenAI prompt cache
+        self.prompt_cache_key = f"ruth:{hashlib.sha256(self.system_prompt.encode('utf-8')).hexdigest()[:16]}"
+
+        # Sorted article titles -> AI category, so re-running a set skips the request
+        self._category_cache: Dict[Tuple[str, ...], str] = {}
+
     def _load_system_prompt(self) -> str:
         """Load custom system prompt from prompt.md"""
         prompt_file = 'prompt.md'
@@ -201,54 +520,170 @@ Focus on creating letters that will be taken seriously by elected officials and
 
         # Load custom prompt
         try:
-            with open(prompt_file, 'r', encoding='utf-8') as f:
-                custom_prompt = f.read()
-                if custom_prompt.strip():
-                    logger.info(f"Loaded custom system prompt from {prompt_file}")
-                    return custom_prompt
-                else:
-                    logger.warning("prompt.md is empty, using default")
-                    return default_prompt
+            custom_prompt = _read_config_file(prompt_file)
+            if custom_prompt.strip():
+                logger.info(f"Loaded custom system prompt from {prompt_file}")
+                return custom_prompt
+            else:
+                logger.warning("prompt.md is empty, using default")
+                return default_prompt
         except Exception as e:
             logger.warning(f"Could not load custom prompt: {e}")
             return default_prompt
 
+    def _complete(self, prompt: str, temperature: float, max_tokens: int, stream: bool = False,
+                  system_prompt: Optional[str] = None) -> str:
+        """
+        Send a prompt after the shared (or the given) system prompt and return the reply text.
+        With stream=True the reply is collected as it is generated.
+        """
+        system_prompt = system_prompt or self.system_prompt
+
+        # Sent as extra_body so older openai SDKs that lack these keywords still work
+        extra_body = {'prompt_cache_key': self.prompt_cache_key}
+        if self.deterministic:
+            temperature = 0
+            extra_body['seed'] = 42
+
+        # Responses are only cached on disk in replay mode (OPENAI_DETERMINISTIC)
+        cache_file = (self._completion_cache_path(system_prompt, prompt, temperature, max_tokens)
+                      if self.deterministic else None)
+        if cache_file:
+            try:
+                content = cache_file.read_text(encoding='utf-8')
+                logger.info("Using cached AI response")
+                return content
+            except OSError:
+                pass
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            extra_body=extra_body,
+            stream=stream
+        )
+        content = self._collect_stream(response) if stream else response.choices[0].message.content
+
+        if cache_file and content:
+            try:
+                self.CACHE_DIR.mkdir(exist_ok=True)
+                cache_file.write_text(content, encoding='utf-8')
+            except OSError as e:
+                logger.warning(f"Could not cache AI response: {e}")
+
+        return content
+
+    def _collect_stream(self, stream) -> str:
+        """Accumulate a streamed reply, reporting the SUBJECT line as soon as it is complete"""
+        buffer = io.StringIO()
+        subject_seen = False
+
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            buffer.write(delta)
+
+            # The subject line comes first, so it is known long before the letter finishes
+            if not subject_seen and '\n' in delta:
+                _, found, rest = buffer.getvalue().partition('SUBJECT:')
+                if found and '\n' in rest:
+                    subject_seen = True
+                    subject = rest.partition('\n')[0].strip()
+                    logger.info(f"Drafting letter: {subject}")
+
+        return buffer.getvalue()
+
+    def _completion_cache_path(self, system_prompt: str, prompt: str, temperature: float, max_tokens: int) -> Path:
+        """Path of the cache entry for a completion request"""
+        key = hashlib.sha256(
+            '\0'.join([self.model, system_prompt, prompt, str(temperature), str(max_tokens)]).encode('utf-8')
+        ).hexdigest()
+        return self.CACHE_DIR / f"{key}.txt"
+
+    def categorize_titles(self, titles: List[str]) -> str:
+        """Ask the AI for the topic category that best fits a set of article titles"""
+        key = tuple(sorted(titles))
+        if key not in self._category_cache:
+            # Listed in key order, so a reordered article set is the same request
+            article_titles = "\n".join(f"- {title}" for title in key)
+            prompt = f"""Based on these article titles, what is the most appropriate category?
+
+Articles:
+{article_titles}
+
+Categories: Agriculture, Banking, Budget, Defense, Education, Energy, Environment,
+Foreign Affairs, Government Reform, Health Care, Homeland Security,
+Immigration, Judiciary, Labor, Social Security, Taxes, Telecommunications,
+Trade, Transportation, Veterans, General
+
+Respond with just the category name."""
+
+            # Temperature 0 so the answer is stable (and replay mode can cache it on disk)
+            self._category_cache[key] = self._complete(
+                prompt, 0, 50, system_prompt="You are a categorization assistant."
+            ).strip()
+        return self._category_cache[key]
+
+    def suggest_focus_areas(self, articles: List[Dict]) -> str:
+        """Ask the AI for six numbered focus areas suited to a set of articles"""
+        # Prepare article summaries (first 3 articles to avoid token limits)
+        article_summaries = "\n".join(
+            f"Title: {article['title']}\nKey points: {article['text'][:500]}"
+            for article in articles[:3]
+        )
+
+        prompt = f"""Based on these news articles about issues affecting Oklahoma, generate 6 specific focus areas that would be relevant for a constituent letter to a government official.
+
+Articles:
+{article_summaries}
+
+Generate 6 focus options that are:
+1. Specific to the issues in these articles
+2. Relevant to Oklahoma constituents
+3. Actionable for government officials
+4. Clear and concise (10-15 words each)
+
+Format as a numbered list, one focus per line. Examples of good focus areas:
+- Impact on rural Oklahoma communities and farmers
+- Effects on working families' healthcare costs
+- Constitutional implications for civil liberties
+- Economic consequences for small businesses
+- Environmental impact on local water resources
+- Effects on veterans and military families
+
+Return ONLY the 6 numbered focus options, nothing else."""
+
+        return self._complete(
+            prompt, temperature=0.7, max_tokens=300,
+            system_prompt="You are a policy analyst helping constituents identify key focus areas for their letters to officials."
+        )
+
     def analyze_articles(self, articles: List[Dict[str, str]]) -> str:
         """Analyze articles and extract key points"""
         try:
             # Prepare article summaries
-            article_summaries = []
-            for i, article in enumerate(articles, 1):
-                summary = f"""
+            article_summaries = "\n".join(
+                f"""
 Article {i}: {article['title']}
 Source: {article['source']}
 Date: {article['publish_date']}
-Key Content: {article['text'][:2000]}...
+Key Content: {_truncate_to_tokens(article['text'], 800, self.model)}...
 """
-                article_summaries.append(summary)
-
-            prompt = f"""Analyze these news articles and extract the key policy issues, concerns, and actionable points relevant to a U.S. Senator:
-
-{chr(10).join(article_summaries)}
-
-Please provide:
-1. Main issue(s) discussed
-2. How this affects Oklahoma constituents
-3. Specific policy implications
-4. Recommended actions for the Senator
-5. Key facts and statistics mentioned"""
-
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert policy analyst helping constituents communicate with their representatives."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1000
+                for i, article in enumerate(articles, 1)
             )
 
-            return response.choices[0].message.content
+            # Static instructions first, so every analysis request shares the same prefix
+            prompt = _ANALYSIS_PROMPT_HEADER + article_summaries
+
+            return self._complete(prompt, temperature=0.7, max_tokens=1000)
 
         except Exception as e:
             logger.error(f"Error analyzing articles: {e}")
@@ -269,13 +704,11 @@ Please provide:
             analysis = self.analyze_articles(articles)
 
             # Prepare the context
-            article_summaries = []
-            for article in articles:
-                article_summaries.append(f"- {article['title']} ({article['source']})")
+            article_summaries = "\n".join(f"- {article['title']} ({article['source']})" for article in articles)
 
             context = f"""
 News Articles Referenced:
-{chr(10).join(article_summaries)}
+{article_summaries}
 
 Analysis:
 {analysis}
@@ -349,10 +782,7 @@ Letter Requirements:
 
 Also provide a brief, compelling subject line (5-10 words).
 
-Format your response as:
-SUBJECT: [subject line here]
-LETTER:
-[letter content here]"""
+""" + _LETTER_RESPONSE_FORMAT
             else:
                 # Default prompt for generic users
                 letter_prompt = f"""Based on the following news articles and context, draft a compelling letter to {recipient_title} {recipient_name} ({office_desc}) from a constituent in Oklahoma.
@@ -372,39 +802,12 @@ Requirements for the letter:
 
 Also provide a brief, compelling subject line (5-10 words) that captures the essence of the letter.
 
-Format your response as:
-SUBJECT: [subject line here]
-LETTER:
-[letter content here]"""
+""" + _LETTER_RESPONSE_FORMAT
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": letter_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1500
-            )
+            full_response = self._complete(letter_prompt, temperature=0.7, max_tokens=1500, stream=True)
 
             # Parse the response
-            full_response = response.choices[0].message.content
-            lines = full_response.split('\n')
-
-            subject = ""
-            letter_body = []
-            in_letter = False
-
-            for line in lines:
-                if line.startswith('SUBJECT:'):
-                    subject = line.replace('SUBJECT:', '').strip()
-                elif line.startswith('LETTER:'):
-                    in_letter = True
-                elif in_letter:
-                    letter_body.append(line)
-
-            # Clean up the letter body
-            letter_text = '\n'.join(letter_body).strip()
+            subject, letter_text = self._parse_letter_response(full_response)
 
             # If parsing failed, use the whole response as the letter
             if not subject or not letter_text:
@@ -419,6 +822,17 @@ LETTER:
             # Return a basic template if AI fails
             return self._fallback_letter(articles, sender_info)
 
+    @staticmethod
+    def _parse_letter_response(full_response: str) -> Tuple[str, str]:
+        """Split a "SUBJECT: ... LETTER: ..." response into (subject, letter); empty strings if absent"""
+        head, found, letter = ('\n' + full_response).partition('\nLETTER:')
+        if not found:
+            return '', ''
+
+        _, found, subject = head.partition('SUBJECT:')
+        subject = subject.partition('\n')[0].strip() if found else ''
+        return subject, letter.strip()
+
     def _fallback_letter(self, articles: List[Dict[str, str]], sender_info: Dict[str, str]) -> Tuple[str, str]:
         """Fallback letter template if AI fails"""
         subject = "Constituent Concern Regarding Recent News"
@@ -465,17 +879,7 @@ FEEDBACK:
 
 Please provide the revised letter maintaining the same general structure but incorporating the requested changes."""
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1500
-            )
-
-            return response.choices[0].message.content
+            return self._complete(prompt, temperature=0.7, max_tokens=1500)
 
         except Exception as e:
             logger.error(f"Error refining letter: {e}")
@@ -493,8 +897,8 @@ Please provide the revised letter maintaining the same general structure but inc
         try:
             # Determine personalization factors
             office_type = recipient.get('office_type', '')
-            is_federal = office_type in ['federal_senate', 'federal_house']
-            is_state = office_type in ['state_senate', 'state_house', 'governor']
+            is_federal = office_type in _FEDERAL_TYPES
+            is_state = office_type in _STATE_TYPES
             is_executive = office_type == 'governor'
             district = recipient.get('district', '')
 
@@ -514,26 +918,16 @@ Please provide the revised letter maintaining the same general structure but inc
                 variation_instructions.append(f"Reference District {district} specific concerns when relevant")
 
             # Vary the approach based on index
-            approach_variations = [
-                "Lead with personal impact and constituent stories",
-                "Emphasize data and statistical evidence",
-                "Focus on constitutional and legal precedents",
-                "Highlight economic implications",
-                "Stress moral and ethical considerations",
-                "Connect to historical context and past policies"
-            ]
-            variation_instructions.append(approach_variations[variation_index % len(approach_variations)])
+            variation_instructions.append(
+                self._APPROACH_VARIATIONS[variation_index % len(self._APPROACH_VARIATIONS)]
+            )
 
             # Vary the call to action
-            action_variations = [
-                "Request a town hall or public meeting",
-                "Ask for specific legislative action or vote",
-                "Request a written response addressing concerns",
-                "Propose specific policy solutions",
-                "Ask for committee consideration or hearings",
-                "Request collaboration with other officials"
-            ]
-            variation_instructions.append(action_variations[variation_index % len(action_variations)])
+            variation_instructions.append(
+                self._ACTION_VARIATIONS[variation_index % len(self._ACTION_VARIATIONS)]
+            )
+
+            personalization_requirements = "\n".join(f"- {inst}" for inst in variation_instructions)
 
             prompt = f"""You need to create a personalized variation of this letter for {recipient['title']} {recipient['name']}.
 
@@ -547,7 +941,7 @@ Recipient details:
 - Organization: {recipient.get('organization', '')}
 
 Personalization requirements:
-{chr(10).join(f"- {inst}" for inst in variation_instructions)}
+{personalization_requirements}
 
 Create a unique version that:
 1. Addresses {recipient['title']} {recipient['name'].split()[-1]} specifically
@@ -559,38 +953,14 @@ Create a unique version that:
 7. Varies sentence structure and word choices
 8. Is NOT a form letter - should feel personally written
 
-Return the personalized letter with format:
-SUBJECT: [new subject line variation]
-LETTER:
-[personalized letter content]"""
-
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.85,  # Higher temperature for more variation
-                max_tokens=1500
-            )
-
-            # Parse response
-            full_response = response.choices[0].message.content
-            lines = full_response.split('\n')
+""" + _PERSONALIZED_RESPONSE_FORMAT
 
-            subject = base_subject  # Default
-            letter_body = []
-            in_letter = False
+            # Higher temperature for more variation
+            full_response = self._complete(prompt, temperature=0.85, max_tokens=1500, stream=True)
 
-            for line in lines:
-                if line.startswith('SUBJECT:'):
-                    subject = line.replace('SUBJECT:', '').strip()
-                elif line.startswith('LETTER:'):
-                    in_letter = True
-                elif in_letter:
-                    letter_body.append(line)
-
-            personalized_letter = '\n'.join(letter_body).strip()
+            # Parse response, keeping the base subject if none was returned
+            subject, personalized_letter = self._parse_letter_response(full_response)
+            subject = subject or base_subject
 
             if not personalized_letter:
                 logger.warning(f"Personalization failed for {recipient['name']}, using base letter")
@@ -608,12 +978,177 @@ LETTER:
             )
             return base_subject, personalized_letter
 
+    def personalize_letters_batch(self,
+                                  base_letter: str,
+                                  base_subject: str,
+                                  recipients: List[Dict],
+                                  articles: List[Dict],
+                                  tone: str,
+                                  focus: str,
+                                  start_index: int = 0,
+                                  on_done: Optional[Callable[[Dict], None]] = None) -> List[Tuple[str, str]]:
+        """
+        Generate personalized variations for several recipients concurrently.
+        Results are returned in recipient order; variation indexes count up from start_index.
+        on_done, if given, is called with each recipient as its letter finishes (from a worker thread).
+        """
+        if not recipients:
+            return []
+
+        # Each request is an independent network round-trip, and the OpenAI client is thread-safe
+        executor = ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(recipients)))
+        futures = [
+            executor.submit(
+                self.personalize_letter_for_recipient,
+                base_letter=base_letter,
+                base_subject=base_subject,
+                recipient=recipient,
+                articles=articles,
+                tone=tone,
+                focus=focus,
+                variation_index=i
+            )
+            for i, recipient in enumerate(recipients, start_index)
+        ]
+        if on_done:
+            for future, recipient in zip(futures, recipients):
+                future.add_done_callback(
+                    lambda f, recipient=recipient: f.cancelled() or on_done(recipient)
+                )
+        # Not a with-block: its exit would wait for every queued request, even on Ctrl-C
+        return _results_in_order(executor, futures)
+
+
+# Process-wide drafter, so the OpenAI client and prompt.md are set up only once
+_drafter_instance: Optional[AILetterDrafter] = None
+
+
+def get_drafter() -> AILetterDrafter:
+    """Return the shared AILetterDrafter, creating it on first use"""
+    global _drafter_instance
+    if _drafter_instance is None:
+        _drafter_instance = AILetterDrafter()
+    return _drafter_instance
+
 
 # ==================== MAILER JSON GENERATOR ====================
 
+# Static layout sections, shared by every mailer JSON rather than rebuilt per letter
+
+# Positioning for a standard #10 envelope
+_POSITIONING = {
+    'unit': 'inches',
+    'margins': {
+        'top': 1.25,
+        'bottom': 1.25,
+        'left': 1.25,
+        'right': 1.25
+    },
+    'return_address': {
+        'x': 0.5,
+        'y': 0.625,
+        'width': 3.5,
+        'height': 1.0
+    },
+    'recipient_address': {
+        'x': 0.75,
+        'y': 2.0625,
+        'width': 4.0,
+        'height': 1.125
+    },
+    'date_position': {
+        'x': 4.875,
+        'y': 1.7,
+        'alignment': 'right'
+    },
+    'body_start_y': 3.67
+}
+
+_FORMATTING = {
+    'font_family': 'Times-Roman',
+    'font_size': 11,
+    'line_spacing': 1.5,
+    'paragraph_spacing': 12,
+    'justify_body': False,
+    'indent_paragraphs': True,
+    'indent_size': 0.5
+}
+
+_FOLD_LINES = {
+    'enabled': True,
+    'positions': [3.67, 7.33],
+    'style': {
+        'line_length_mm': 4,
+        'margin_offset_mm': 3,
+        'color': '#CCCCCC',
+        'line_width': 0.5,
+        'line_style': 'solid'
+    }
+}
+
+_HEADER_PAGE_1 = {
+    'enabled': False,
+    'left': '',
+    'center': '',
+    'right': ''
+}
+
+_FOOTER = {
+    'enabled': True,
+    'left': '',
+    'center': 'Page {page} of {total}',
+    'right': '',
+    'font_size': 10,
+    'color': '#666666',
+    'line_above': True
+}
+
+_PAGE_SETTINGS = {
+    'paper_size': 'letter',
+    'orientation': 'portrait',
+    'page_numbers': {
+        'show': True,
+        'position': 'bottom_center',
+        'start_on_page': 1
+    }
+}
+
+
+def _intern(value):
+    """sys.intern a string loaded from JSON, passing through nulls and other types"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@functools.lru_cache(maxsize=512)
+def _reference_token(name: str) -> str:
+    """Recipient name as used in mailer reference ids"""
+    return name.replace(' ', '_').upper()
+
+
 class MailerJSONGenerator:
     """Generates JSON objects for the mailer PDF system"""
 
+    # (key path in recipients.json, office_type, organization, has_district), in display order
+    RECIPIENT_CATEGORIES = (
+        (('federal', 'senate'), 'federal_senate', 'United States Senate', False),
+        (('federal', 'house'), 'federal_house', 'United States House of Representatives', True),
+        (('state', 'executive', 'governor'), 'governor', 'Office of the Governor', False),
+        (('state', 'senate'), 'state_senate', 'Oklahoma State Senate', True),
+        (('state', 'house'), 'state_house', 'Oklahoma House of Representatives', True),
+    )
+
+    # Letter closings, matched at the start of a line
+    _CLOSING_RE = re.compile(r'^\s*(?:Sincerely|Respectfully|Best regards|Thank you|Yours truly)', re.I)
+
+    # Salutation line
+    _DEAR_RE = re.compile(r'\s*Dear')
+
+    # Mentions of an enclosure anywhere in the letter
+    _ENCLOSE_RE = re.compile('enclos', re.I)
+
+    # Signature block fragments the AI sometimes repeats inside the body
+    _SIG_RE = re.compile('|'.join(map(re.escape, ['Brian West', '714 E Osage', 'McAlester', '918', 'brian@'])))
+
     def __init__(self):
         # Load return address from environment variables
         self.return_address = self._load_return_address()
@@ -644,30 +1179,29 @@ class MailerJSONGenerator:
 
         # Load from sender.json
         try:
-            with open(sender_file, 'r', encoding='utf-8') as f:
-                sender_data = json.load(f)
-                logger.info(f"Loaded sender information from {sender_file}")
-
-                # Check if it's still the example data
-                if sender_data.get('email', '').endswith('@example.com'):
-                    print("\n⚠️  WARNING: sender.json still contains example data!")
-                    print("   Please update it with your actual information.")
-                    response = input("\n   Continue anyway? (y/n): ").strip().lower()
-                    if response != 'y':
-                        sys.exit(1)
-
-                # Extract address fields
-                return {
-                    'name': sender_data.get('name'),
-                    'street_1': sender_data.get('street_1'),
-                    'street_2': sender_data.get('street_2', ''),
-                    'city': sender_data.get('city'),
-                    'state': sender_data.get('state'),
-                    'zip': sender_data.get('zip'),
-                    'phone': sender_data.get('phone', ''),
-                    'email': sender_data.get('email', ''),
-                    'title': sender_data.get('title', '')
-                }
+            sender_data = _read_config_file(sender_file, _json_loads)
+            logger.info(f"Loaded sender information from {sender_file}")
+
+            # Check if it's still the example data
+            if sender_data.get('email', '').endswith('@example.com'):
+                print("\n⚠️  WARNING: sender.json still contains example data!")
+                print("   Please update it with your actual information.")
+                response = input("\n   Continue anyway? (y/n): ").strip().lower()
+                if response != 'y':
+                    sys.exit(1)
+
+            # Extract address fields
+            return {
+                'name': sender_data.get('name'),
+                'street_1': sender_data.get('street_1'),
+                'street_2': sender_data.get('street_2', ''),
+                'city': sender_data.get('city'),
+                'state': sender_data.get('state'),
+                'zip': sender_data.get('zip'),
+                'phone': sender_data.get('phone', ''),
+                'email': sender_data.get('email', ''),
+                'title': sender_data.get('title', '')
+            }
         except Exception as e:
             logger.error(f"Error loading sender.json: {e}")
             print(f"\n❌ ERROR: Failed to load sender.json: {e}")
@@ -682,126 +1216,14 @@ class MailerJSONGenerator:
         # Load from JSON
         if os.path.exists(json_file):
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # Process federal officials
-                if 'federal' in data:
-                    # Federal Senate
-                    for senator in data['federal'].get('senate', []):
-                        for office_key, office in senator.get('offices', {}).items():
-                            recipients.append({
-                                'id': f"{senator['id']}_{office_key}",
-                                'full_name': senator['full_name'],
-                                'name': senator['name'],
-                                'title': senator['title'],
-                                'honorific': senator['honorific'],
-                                'organization': 'United States Senate',
-                                'street_1': office['street_1'],
-                                'street_2': office.get('street_2', ''),
-                                'city': office['city'],
-                                'state': office['state'],
-                                'zip': office['zip'],
-                                'phone': office.get('phone', ''),
-                                'office_type': 'federal_senate',
-                                'office_location': office_key,
-                                'office_name': office['name'],
-                                'party': senator.get('party', '')
-                            })
-
-                    # Federal House
-                    for rep in data['federal'].get('house', []):
-                        for office_key, office in rep.get('offices', {}).items():
-                            recipients.append({
-                                'id': f"{rep['id']}_{office_key}",
-                                'full_name': rep['full_name'],
-                                'name': rep['name'],
-                                'title': rep['title'],
-                                'honorific': rep['honorific'],
-                                'organization': 'United States House of Representatives',
-                                'street_1': office['street_1'],
-                                'street_2': office.get('street_2', ''),
-                                'city': office['city'],
-                                'state': office['state'],
-                                'zip': office['zip'],
-                                'phone': office.get('phone', ''),
-                                'office_type': 'federal_house',
-                                'office_location': office_key,
-                                'office_name': office['name'],
-                                'district': rep.get('district', ''),
-                                'party': rep.get('party', '')
-                            })
-
-                # Process state officials
-                if 'state' in data:
-                    # Governor
-                    if 'executive' in data['state'] and 'governor' in data['state']['executive']:
-                        gov = data['state']['executive']['governor']
-                        for office_key, office in gov.get('offices', {}).items():
-                            recipients.append({
-                                'id': f"{gov['id']}_{office_key}",
-                                'full_name': gov['full_name'],
-                                'name': gov['name'],
-                                'title': gov['title'],
-                                'honorific': gov['honorific'],
-                                'organization': 'Office of the Governor',
-                                'street_1': office['street_1'],
-                                'street_2': office.get('street_2', ''),
-                                'city': office['city'],
-                                'state': office['state'],
-                                'zip': office['zip'],
-                                'phone': office.get('phone', ''),
-                                'office_type': 'governor',
-                                'office_location': office_key,
-                                'office_name': office['name'],
-                                'party': gov.get('party', '')
-                            })
-
-                    # State Senate
-                    for senator in data['state'].get('senate', []):
-                        for office_key, office in senator.get('offices', {}).items():
-                            recipients.append({
-                                'id': f"{senator['id']}_{office_key}",
-                                'full_name': senator['full_name'],
-                                'name': senator['name'],
-                                'title': senator['title'],
-                                'honorific': senator['honorific'],
-                                'organization': 'Oklahoma State Senate',
-                                'street_1': office['street_1'],
-                                'street_2': office.get('street_2', ''),
-                                'city': office['city'],
-                                'state': office['state'],
-                                'zip': office['zip'],
-                                'phone': office.get('phone', ''),
-                                'office_type': 'state_senate',
-                                'office_location': office_key,
-                                'office_name': office['name'],
-                                'district': senator.get('district', ''),
-                                'party': senator.get('party', '')
-                            })
-
-                    # State House
-                    for rep in data['state'].get('house', []):
-                        for office_key, office in rep.get('offices', {}).items():
-                            recipients.append({
-                                'id': f"{rep['id']}_{office_key}",
-                                'full_name': rep['full_name'],
-                                'name': rep['name'],
-                                'title': rep['title'],
-                                'honorific': rep['honorific'],
-                                'organization': 'Oklahoma House of Representatives',
-                                'street_1': office['street_1'],
-                                'street_2': office.get('street_2', ''),
-                                'city': office['city'],
-                                'state': office['state'],
-                                'zip': office['zip'],
-                                'phone': office.get('phone', ''),
-                                'office_type': 'state_house',
-                                'office_location': office_key,
-                                'office_name': office['name'],
-                                'district': rep.get('district', ''),
-                                'party': rep.get('party', '')
-                            })
+                data = _read_config_file(json_file, _json_loads)
+
+                recipients = [
+                    self._flatten_official(official, office_key, office, office_type, organization, has_district)
+                    for path, office_type, organization, has_district in self.RECIPIENT_CATEGORIES
+                    for official in self._officials_at(data, path)
+                    for office_key, office in official.get('offices', {}).items()
+                ]
 
                 if recipients:
                     logger.info(f"Loaded {len(recipients)} recipients from {json_file}")
@@ -820,6 +1242,47 @@ class MailerJSONGenerator:
 
         return recipients
 
+    @staticmethod
+    def _officials_at(data: Dict, path: Tuple[str, ...]) -> List[Dict]:
+        """Return the officials stored under a key path of recipients.json"""
+        node = data
+        for key in path:
+            if not isinstance(node, dict) or key not in node:
+                return []
+            node = node[key]
+
+        # Single officeholders (e.g. the governor) are stored as one object
+        return node if isinstance(node, list) else [node]
+
+    @staticmethod
+    def _flatten_official(official: Dict, office_key: str, office: Dict,
+                          office_type: str, organization: str, has_district: bool) -> Dict:
+        """Build the recipient entry for one office of an official"""
+        # Values shared by many recipients (titles, cities, office names, parties) are
+        # interned so every entry references one string instead of a decoded copy
+        intern = _intern
+        recipient = {
+            'id': f"{official['id']}_{office_key}",
+            'full_name': official['full_name'],
+            'name': official['name'],
+            'title': intern(official['title']),
+            'honorific': intern(official['honorific']),
+            'organization': organization,
+            'street_1': office['street_1'],
+            'street_2': office.get('street_2', ''),
+            'city': intern(office['city']),
+            'state': intern(office['state']),
+            'zip': office['zip'],
+            'phone': office.get('phone', ''),
+            'office_type': office_type,
+            'office_location': intern(office_key),
+            'office_name': intern(office['name'])
+        }
+        if has_district:
+            recipient['district'] = official.get('district', '')
+        recipient['party'] = intern(official.get('party', ''))
+        return recipient
+
     def set_recipient(self, recipient: Dict):
         """Set the current recipient"""
         self.current_recipient = recipient
@@ -827,46 +1290,12 @@ class MailerJSONGenerator:
     @property
     def default_positioning(self):
         """Default positioning for standard #10 envelope"""
-        return {
-            'unit': 'inches',
-            'margins': {
-                'top': 1.25,
-                'bottom': 1.25,
-                'left': 1.25,
-                'right': 1.25
-            },
-            'return_address': {
-                'x': 0.5,
-                'y': 0.625,
-                'width': 3.5,
-                'height': 1.0
-            },
-            'recipient_address': {
-                'x': 0.75,
-                'y': 2.0625,
-                'width': 4.0,
-                'height': 1.125
-            },
-            'date_position': {
-                'x': 4.875,
-                'y': 1.7,
-                'alignment': 'right'
-            },
-            'body_start_y': 3.67
-        }
+        return _POSITIONING
 
     @property
     def default_formatting(self):
         """Default formatting for letters"""
-        return {
-            'font_family': 'Times-Roman',
-            'font_size': 11,
-            'line_spacing': 1.5,
-            'paragraph_spacing': 12,
-            'justify_body': False,
-            'indent_paragraphs': True,
-            'indent_size': 0.5
-        }
+        return _FORMATTING
 
     def parse_letter_content(self, letter_text: str) -> Dict[str, any]:
         """Parse the AI-generated letter into components"""
@@ -893,7 +1322,7 @@ class MailerJSONGenerator:
 
         salutation = default_salutation
         for i, line in enumerate(lines):
-            if line.strip().startswith("Dear"):
+            if self._DEAR_RE.match(line):
                 salutation = line.strip().rstrip(',')
                 salutation_idx = i
                 break
@@ -901,12 +1330,12 @@ class MailerJSONGenerator:
         # Find closing (Sincerely, Respectfully, etc.)
         closing_idx = len(lines) - 1
         closing = "Respectfully"
-        closing_keywords = ['Sincerely', 'Respectfully', 'Best regards', 'Thank you', 'Yours truly']
 
+        # The pattern skips leading whitespace itself, so only the matching line is stripped
+        closing_re = self._CLOSING_RE
         for i in range(len(lines) - 1, salutation_idx, -1):
-            line = lines[i].strip().rstrip(',')
-            if any(keyword in line for keyword in closing_keywords):
-                closing = line
+            if closing_re.match(lines[i]):
+                closing = lines[i].strip().rstrip(',')
                 closing_idx = i
                 break
 
@@ -940,11 +1369,7 @@ class MailerJSONGenerator:
             paragraphs.append(' '.join(current_paragraph))
 
         # Remove any signature block lines that might have been included
-        cleaned_paragraphs = []
-        for para in paragraphs:
-            # Skip lines that look like signature block
-            if not any(skip in para for skip in ['Brian West', '714 E Osage', 'McAlester', '918', 'brian@']):
-                cleaned_paragraphs.append(para)
+        cleaned_paragraphs = [para for para in paragraphs if not self._SIG_RE.search(para)]
 
         return {
             'salutation': salutation,
@@ -960,42 +1385,47 @@ class MailerJSONGenerator:
                            date: Optional[str] = None) -> Dict:
         """Generate complete JSON object for mailer system"""
 
-        if not self.current_recipient:
+        r = self.current_recipient
+        if not r:
             raise ValueError("No recipient selected. Call set_recipient() first.")
+        ra = custom_return_address or self.return_address
 
         # Parse the letter content
         content_parts = self.parse_letter_content(letter_text)
 
-        # Set date
-        letter_date = date or datetime.now().strftime('%Y-%m-%d')
+        # One clock read covers both the letter date and the reference id
+        now = datetime.now()
+        letter_date = date or now.strftime('%Y-%m-%d')
 
         # Determine document type based on office type
         doc_type = 'congressional'
-        if self.current_recipient['office_type'] in ['state_house', 'state_senate']:
+        office_type = r['office_type']
+        if office_type in ['state_house', 'state_senate']:
             doc_type = 'state_legislative'
-        elif self.current_recipient['office_type'] == 'governor':
+        elif office_type == 'governor':
             doc_type = 'executive'
 
         # Build the JSON object
+        name = r['name']
         mailer_json = {
             'metadata': {
                 'type': doc_type,
                 'date': letter_date,
                 'date_format': 'full',
-                'reference_id': f"{self.current_recipient['name'].replace(' ', '_').upper()}_{category.upper()}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                'reference_id': f"{_reference_token(name)}_{category.upper()}_{now.strftime('%Y%m%d_%H%M%S')}"
             },
-            'positioning': self.default_positioning,
-            'return_address': custom_return_address or self.return_address,
+            'positioning': _POSITIONING,
+            'return_address': ra,
             'recipient_address': {
-                'honorific': self.current_recipient.get('honorific', 'The Honorable'),
-                'name': self.current_recipient['name'],
-                'title': self.current_recipient.get('title', ''),
-                'organization': self.current_recipient.get('organization', ''),
-                'street_1': self.current_recipient['street_1'],
-                'street_2': self.current_recipient.get('street_2', ''),
-                'city': self.current_recipient['city'],
-                'state': self.current_recipient['state'],
-                'zip': self.current_recipient['zip']
+                'honorific': r.get('honorific', 'The Honorable'),
+                'name': name,
+                'title': r.get('title', ''),
+                'organization': r.get('organization', ''),
+                'street_1': r['street_1'],
+                'street_2': r.get('street_2', ''),
+                'city': r['city'],
+                'state': r['state'],
+                'zip': r['zip']
             },
             'content': {
                 'salutation': content_parts['salutation'],
@@ -1004,32 +1434,17 @@ class MailerJSONGenerator:
                 'closing': content_parts['closing'],
                 'signature': {
                     'type': 'typed',
-                    'typed_name': (custom_return_address or self.return_address).get('name', 'Brian West'),
-                    'title': (custom_return_address or self.return_address).get('title', '')
-                }
-            },
-            'formatting': self.default_formatting,
-            'fold_lines': {
-                'enabled': True,
-                'positions': [3.67, 7.33],
-                'style': {
-                    'line_length_mm': 4,
-                    'margin_offset_mm': 3,
-                    'color': '#CCCCCC',
-                    'line_width': 0.5,
-                    'line_style': 'solid'
+                    'typed_name': ra.get('name', 'Brian West'),
+                    'title': ra.get('title', '')
                 }
             },
+            'formatting': _FORMATTING,
+            'fold_lines': _FOLD_LINES,
             'header': {
-                'page_1': {
-                    'enabled': False,
-                    'left': '',
-                    'center': '',
-                    'right': ''
-                },
+                'page_1': _HEADER_PAGE_1,
                 'subsequent': {
                     'enabled': True,
-                    'left': self.current_recipient['name'],
+                    'left': name,
                     'center': 'Page {page}',
                     'right': '{formatted_date}'
                 },
@@ -1037,28 +1452,12 @@ class MailerJSONGenerator:
                 'color': '#333333',
                 'line_below': True
             },
-            'footer': {
-                'enabled': True,
-                'left': '',
-                'center': 'Page {page} of {total}',
-                'right': '',
-                'font_size': 10,
-                'color': '#666666',
-                'line_above': True
-            },
-            'page_settings': {
-                'paper_size': 'letter',
-                'orientation': 'portrait',
-                'page_numbers': {
-                    'show': True,
-                    'position': 'bottom_center',
-                    'start_on_page': 1
-                }
-            }
+            'footer': _FOOTER,
+            'page_settings': _PAGE_SETTINGS
         }
 
         # Add postscript if the letter mentions enclosures or cc
-        if 'enclos' in letter_text.lower():
+        if self._ENCLOSE_RE.search(letter_text):
             mailer_json['content']['enclosures'] = ['Documents as referenced']
 
         return mailer_json
@@ -1068,14 +1467,14 @@ class MailerJSONGenerator:
         # Create output directory if it doesn't exist
         Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-        # Generate filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        ref_id = mailer_json['metadata'].get('reference_id', f'letter_{timestamp}')
+        # Generate filename; only fall back to a timestamp when there is no reference id
+        ref_id = mailer_json['metadata'].get('reference_id')
+        if ref_id is None:
+            ref_id = f"letter_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         filename = f"{output_dir}/{ref_id}.json"
 
         # Save JSON
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(mailer_json, f, indent=2, ensure_ascii=False)
+        _write_bytes(filename, _json_dumps(mailer_json))
 
         logger.info(f"Saved mailer JSON to: {filename}")
         return filename
@@ -1083,19 +1482,117 @@ class MailerJSONGenerator:
 
 # ==================== INTERACTIVE SYSTEM ====================
 
+def _iso_from_ns(ns: int) -> str:
+    """Render a time.time_ns() timestamp as a local ISO 8601 string"""
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+def _slugify(name: str) -> str:
+    """Recipient name as used in output filenames, e.g. 'Kevin Stitt' -> 'kevin_stitt'"""
+    return name.lower().replace(' ', '_')
+
+
+# Screen rules, built once instead of on every print
+_RULE = "=" * 70
+_SEPARATOR = "-" * 70
+_HALF_SEPARATOR = "-" * 35
+
+# Topic categories and the keywords that suggest them
+_TOPIC_KEYWORDS = {
+    'Agriculture': ['farm', 'agriculture', 'crops', 'livestock', 'farmer', 'ranch', 'usda'],
+    'Banking': ['bank', 'financial', 'credit', 'loan', 'mortgage', 'fdic', 'federal reserve'],
+    'Budget': ['budget', 'spending', 'deficit', 'debt', 'appropriation', 'fiscal'],
+    'Defense': ['military', 'defense', 'pentagon', 'army', 'navy', 'air force', 'veteran'],
+    'Education': ['school', 'education', 'student', 'teacher', 'university', 'college'],
+    'Energy': ['energy', 'oil', 'gas', 'renewable', 'solar', 'wind', 'pipeline', 'electricity'],
+    'Environment': ['environment', 'climate', 'pollution', 'conservation', 'epa', 'clean'],
+    'Foreign Affairs': ['foreign', 'international', 'treaty', 'embassy', 'diplomatic'],
+    'Government Reform': ['government', 'reform', 'regulation', 'bureaucracy', 'accountability'],
+    'Health Care': ['health', 'medical', 'medicare', 'medicaid', 'insurance', 'hospital', 'doctor'],
+    'Homeland Security': ['security', 'terrorism', 'border', 'immigration', 'customs', 'tsa'],
+    'Immigration': ['immigration', 'immigrant', 'visa', 'citizenship', 'refugee', 'asylum'],
+    'Judiciary': ['court', 'judge', 'justice', 'legal', 'law', 'constitution'],
+    'Labor': ['labor', 'union', 'worker', 'employment', 'wage', 'workplace', 'osha'],
+    'Social Security': ['social security', 'retirement', 'pension', 'disability', 'elderly'],
+    'Taxes': ['tax', 'irs', 'revenue', 'deduction', 'credit', 'taxation'],
+    'Telecommunications': ['telecom', 'internet', 'broadband', 'fcc', 'network', 'cable'],
+    'Trade': ['trade', 'tariff', 'export', 'import', 'nafta', 'commerce'],
+    'Transportation': ['transportation', 'highway', 'road', 'bridge', 'transit', 'infrastructure'],
+    'Veterans': ['veteran', 'va', 'military service', 'gi bill', 'vfw']
+}
+
+# Flat keyword -> categories index; some keywords suggest more than one category
+_KEYWORD_CATEGORIES: Dict[str, List[str]] = {
+    keyword.lower(): [category for category, keywords in _TOPIC_KEYWORDS.items() if keyword in keywords]
+    for keywords in _TOPIC_KEYWORDS.values()
+    for keyword in keywords
+}
+
+
 class InteractiveMailerSystem:
     """Interactive system for generating mailer JSON files"""
 
+    # Recipient menu groups in display order: (office_type, heading)
+    GROUP_ORDER = (
+        ('governor', "🏛️  GOVERNOR:"),
+        ('federal_senate', "🇺🇸 U.S. SENATORS:"),
+        ('federal_house', "🏛️  U.S. REPRESENTATIVES:"),
+        ('state_senate', "🏛️  STATE SENATORS:"),
+        ('state_house', "🏛️  STATE REPRESENTATIVES:"),
+    )
+
+    # Session event lists whose 'timestamp' is kept as time.time_ns() until saved
+    TIMESTAMPED_EVENTS = ('drafts', 'revisions', 'user_edits', 'ai_interactions', 'generated_letters')
+
+    # Recipient selection keywords: (office types or None for everyone,
+    # office to pick for each official or None to ask, confirmation message)
+    SELECTION_PRESETS = {
+        'all': (None, None, None),
+        'federal': (_FEDERAL_TYPES, None, None),
+        'state': (_STATE_TYPES, None, None),
+        'federal-dc': (_FEDERAL_TYPES, 'dc', "✓ Selecting federal officials with DC offices..."),
+        'federal-local': (_FEDERAL_TYPES, 'local', "✓ Selecting federal officials with local offices..."),
+        'state-local': (_STATE_TYPES, 'local', "✓ Selecting state officials with local offices..."),
+    }
+
+    # Letter review menu in display order: (action, label)
+    REVIEW_OPTIONS = (
+        ('accept', "Accept and generate mailer JSON"),
+        ('edit', "Edit in visual editor"),
+        ('revise', "Request AI revision"),
+        ('regenerate', "Regenerate with different tone/focus"),
+        ('articles', "View source articles"),
+        ('compare', "Compare with base letter"),
+        ('save', "Save draft and exit"),
+        ('discard', "Discard and exit"),
+    )
+
+    # Focus areas offered when the AI cannot suggest any (or enough)
+    DEFAULT_FOCUS_OPTIONS = (
+        "Impact on rural Oklahoma communities",
+        "Economic effects on working families",
+        "Constitutional and democratic principles",
+        "Healthcare access and affordability",
+        "Education and workforce development",
+        "Infrastructure and public services",
+    )
+
+    # A numbered or bulleted list item; the group is the text after the marker
+    _FOCUS_LINE_RE = re.compile(r'\s*[0-9\-•][0-9.\-•]*(.*)')
+
     def __init__(self):
         self.fetcher = NewsArticleFetcher()
-        self.drafter = AILetterDrafter()
+        self.drafter = get_drafter()
         self.json_generator = MailerJSONGenerator()
 
         # Session data
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        started = datetime.now()
+        self.session_id = started.strftime("%Y%m%d_%H%M%S")
+        self._output_dir = Path('mailer_output') / self.session_id
+        self._output_dir_created = False
         self.session_data = {
             'session_id': self.session_id,
-            'start_time': datetime.now().isoformat(),
+            'start_time': started.isoformat(),
             'news_articles': [],
             'drafts': [],
             'revisions': [],
@@ -1103,38 +1600,44 @@ class InteractiveMailerSystem:
             'mailer_json': None,
             'output_files': [],
             'ai_interactions': [],
-            'user_edits': []
+            'user_edits': [],
+            'generated_letters': []
         }
+        # Whether session_data has changed since save_session last wrote it, and where that was
+        self._session_dirty = True
+        self._session_saved_to: Optional[str] = None
+        # Where save_session writes by default; run() points it into the output directory
+        self._session_file: Optional[str] = None
 
         # Configuration
         self.config = self._load_config()
 
+        # (recipient list, officials index) for the recipient menu
+        self._officials_cache = None
+
+        # Append-only JSONL history, opened on the first logged event. It sits next to
+        # session_<id>.data until letters are written, then moves into the output directory
+        # (so cancelled sessions don't leave an output directory without letters)
+        self._session_log = None
+        self._session_log_path: Optional[Path] = None
+
         # Topic categories
-        self.topic_keywords = {
-            'Agriculture': ['farm', 'agriculture', 'crops', 'livestock', 'farmer', 'ranch', 'usda'],
-            'Banking': ['bank', 'financial', 'credit', 'loan', 'mortgage', 'fdic', 'federal reserve'],
-            'Budget': ['budget', 'spending', 'deficit', 'debt', 'appropriation', 'fiscal'],
-            'Defense': ['military', 'defense', 'pentagon', 'army', 'navy', 'air force', 'veteran'],
-            'Education': ['school', 'education', 'student', 'teacher', 'university', 'college'],
-            'Energy': ['energy', 'oil', 'gas', 'renewable', 'solar', 'wind', 'pipeline', 'electricity'],
-            'Environment': ['environment', 'climate', 'pollution', 'conservation', 'epa', 'clean'],
-            'Foreign Affairs': ['foreign', 'international', 'treaty', 'embassy', 'diplomatic'],
-            'Government Reform': ['government', 'reform', 'regulation', 'bureaucracy', 'accountability'],
-            'Health Care': ['health', 'medical', 'medicare', 'medicaid', 'insurance', 'hospital', 'doctor'],
-            'Homeland Security': ['security', 'terrorism', 'border', 'immigration', 'customs', 'tsa'],
-            'Immigration': ['immigration', 'immigrant', 'visa', 'citizenship', 'refugee', 'asylum'],
-            'Judiciary': ['court', 'judge', 'justice', 'legal', 'law', 'constitution'],
-            'Labor': ['labor', 'union', 'worker', 'employment', 'wage', 'workplace', 'osha'],
-            'Social Security': ['social security', 'retirement', 'pension', 'disability', 'elderly'],
-            'Taxes': ['tax', 'irs', 'revenue', 'deduction', 'credit', 'taxation'],
-            'Telecommunications': ['telecom', 'internet', 'broadband', 'fcc', 'network', 'cable'],
-            'Trade': ['trade', 'tariff', 'export', 'import', 'nafta', 'commerce'],
-            'Transportation': ['transportation', 'highway', 'road', 'bridge', 'transit', 'infrastructure'],
-            'Veterans': ['veteran', 'va', 'military service', 'gi bill', 'vfw']
-        }
+        self.topic_keywords = _TOPIC_KEYWORDS
 
         # Detect available editors
         self.editor = self._detect_editor()
+        self._edit_file: Optional[Path] = None
+
+    @staticmethod
+    def _prompt_choice(prompt: str) -> str:
+        """Read a menu answer, stripped and lower-cased (menu answers are nearly always lower case already)"""
+        answer = input(prompt).strip()
+        return answer if answer.islower() else answer.lower()
+
+    @staticmethod
+    def _now() -> str:
+        """Current local time as an ISO 8601 string, taken once per user action"""
+        return datetime.now().isoformat()
 
     def _load_config(self) -> Dict:
         """Load configuration from sender.json"""
@@ -1156,20 +1659,19 @@ class InteractiveMailerSystem:
 
         # Load configuration from sender.json
         try:
-            with open(sender_file, 'r', encoding='utf-8') as f:
-                sender_data = json.load(f)
-                config = {
-                    'first_name': sender_data.get('first_name'),
-                    'last_name': sender_data.get('last_name'),
-                    'street_address': sender_data.get('street_1'),
-                    'city': sender_data.get('city'),
-                    'state': sender_data.get('state'),
-                    'zip_code': sender_data.get('zip'),
-                    'phone': sender_data.get('phone', ''),
-                    'email': sender_data.get('email', ''),
-                    'openai_model': os.getenv('OPENAI_MODEL', 'gpt-4-turbo-preview'),
-                }
-                logger.info("Loaded sender configuration from sender.json")
+            sender_data = _read_config_file(sender_file, _json_loads)
+            config = {
+                'first_name': sender_data.get('first_name'),
+                'last_name': sender_data.get('last_name'),
+                'street_address': sender_data.get('street_1'),
+                'city': sender_data.get('city'),
+                'state': sender_data.get('state'),
+                'zip_code': sender_data.get('zip'),
+                'phone': sender_data.get('phone', ''),
+                'email': sender_data.get('email', ''),
+                'openai_model': os.getenv('OPENAI_MODEL', 'gpt-4-turbo-preview'),
+            }
+            logger.info("Loaded sender configuration from sender.json")
         except Exception as e:
             logger.error(f"Error loading sender.json: {e}")
             print(f"\n❌ ERROR: Failed to load sender.json: {e}")
@@ -1189,26 +1691,28 @@ class InteractiveMailerSystem:
             if self._command_exists(ed):
                 return ed
 
-        return 'vi' if platform.system() != 'Windows' else 'notepad'
+        return 'vi' if not _IS_WINDOWS else 'notepad'
 
-    def _command_exists(self, command: str) -> bool:
-        """Check if a command exists"""
-        try:
-            subprocess.run(['which', command], capture_output=True, check=True)
-            return True
-        except:
-            return False
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _command_exists(command: str) -> bool:
+        """Check if a command exists on PATH"""
+        return shutil.which(command) is not None
 
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if platform.system() == 'Windows' else 'clear')
+        if _IS_WINDOWS:
+            os.system('cls')
+        else:
+            sys.stdout.write(_ANSI_CLEAR)
+            sys.stdout.flush()
 
     def display_header(self, title: str):
         """Display a formatted header"""
         self.clear_screen()
-        print("=" * 70)
+        print(_RULE)
         print(f" {title.center(68)} ")
-        print("=" * 70)
+        print(_RULE)
 
     def collect_news_articles(self) -> List[str]:
         """Interactively collect news article URLs"""
@@ -1237,7 +1741,7 @@ class InteractiveMailerSystem:
             print(f"✓ Added article #{len(urls)}\n")
 
             if len(urls) >= 5:
-                another = input("Add another article? (y/n): ").strip().lower()
+                another = self._prompt_choice("Add another article? (y/n): ")
                 if another != 'y':
                     break
 
@@ -1247,21 +1751,22 @@ class InteractiveMailerSystem:
         """Fetch and display article summaries"""
         self.display_header("STEP 2: ANALYZING ARTICLES")
 
-        articles = []
-        for i, url in enumerate(urls, 1):
-            print(f"\n📥 Fetching article {i}/{len(urls)}...")
-            print(f"   URL: {url}")
+        print(f"\n📥 Fetching {len(urls)} article(s)...")
+        articles = self.fetcher.fetch_multiple_articles(urls)
+        fetched_at = self._now()  # The batch is fetched concurrently, so it shares one time
 
-            article = self.fetcher.fetch_article(url)
-            articles.append(article)
+        for i, article in enumerate(articles, 1):
+            print(f"\n📄 Article {i}/{len(articles)}")
+            print(f"   URL: {article['url']}")
 
             self.session_data['news_articles'].append({
                 'url': article['url'],
                 'title': article['title'],
                 'source': article['source'],
                 'length': len(article['text']),
-                'fetched_at': datetime.now().isoformat()
+                'fetched_at': fetched_at
             })
+            self._session_dirty = True
 
             print(f"   ✓ Title: {article['title'][:60]}...")
             print(f"   ✓ Source: {article['source']}")
@@ -1274,15 +1779,18 @@ class InteractiveMailerSystem:
         """Use AI to detect the most appropriate topic category"""
         print("\n🤖 Analyzing content to determine topic category...")
 
-        combined_text = " ".join([a['text'][:1000] for a in articles])
+        # Lower-case each slice as it is joined, rather than copying the whole text twice
+        lowered = " ".join(a['text'][:1000].lower() for a in articles)
         if letter_content:
-            combined_text += " " + letter_content
+            lowered += " " + letter_content.lower()
 
-        scores = {}
-        for category, keywords in self.topic_keywords.items():
-            score = sum(1 for keyword in keywords if keyword.lower() in combined_text.lower())
-            if score > 0:
-                scores[category] = score
+        # Each distinct keyword is searched once, crediting every category it suggests
+        counts = dict.fromkeys(self.topic_keywords, 0)
+        for keyword, categories in _KEYWORD_CATEGORIES.items():
+            if keyword in lowered:
+                for category in categories:
+                    counts[category] += 1
+        scores = {category: score for category, score in counts.items() if score > 0}
 
         if scores:
             detected_category = max(scores, key=scores.get)
@@ -1292,38 +1800,16 @@ class InteractiveMailerSystem:
             confidence = "low"
 
         try:
-            prompt = f"""Based on these article titles, what is the most appropriate category?
-
-Articles:
-{chr(10).join([f"- {a['title']}" for a in articles])}
-
-Categories: Agriculture, Banking, Budget, Defense, Education, Energy, Environment,
-Foreign Affairs, Government Reform, Health Care, Homeland Security,
-Immigration, Judiciary, Labor, Social Security, Taxes, Telecommunications,
-Trade, Transportation, Veterans, General
-
-Respond with just the category name."""
-
-            response = self.drafter.client.chat.completions.create(
-                model=self.drafter.model,
-                messages=[
-                    {"role": "system", "content": "You are a categorization assistant."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=50
-            )
-
-            ai_category = response.choices[0].message.content.strip()
+            ai_category = self.drafter.categorize_titles([a['title'] for a in articles])
             valid_categories = list(self.topic_keywords.keys()) + ['General']
             if ai_category in valid_categories:
                 detected_category = ai_category
                 confidence = "high"
 
-            self.session_data['ai_interactions'].append({
+            self._log_event('ai_interactions', {
                 'type': 'category_detection',
                 'result': ai_category,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.time_ns()
             })
 
         except Exception as e:
@@ -1332,7 +1818,7 @@ Respond with just the category name."""
         print(f"   ✓ Detected category: {detected_category} (confidence: {confidence})")
 
         print(f"\n📂 Suggested category: {detected_category}")
-        use_suggested = input("Use this category? (y/n): ").strip().lower()
+        use_suggested = self._prompt_choice("Use this category? (y/n): ")
 
         if use_suggested != 'y':
             print("\nAvailable categories:")
@@ -1356,82 +1842,26 @@ Respond with just the category name."""
     def generate_focus_options(self, articles: List[Dict]) -> List[str]:
         """Use AI to generate contextually relevant focus options based on articles"""
         try:
-            # Prepare article summaries
-            article_summaries = []
-            for article in articles[:3]:  # Use first 3 articles to avoid token limits
-                summary = f"Title: {article['title']}\nKey points: {article['text'][:500]}"
-                article_summaries.append(summary)
-
-            prompt = f"""Based on these news articles about issues affecting Oklahoma, generate 6 specific focus areas that would be relevant for a constituent letter to a government official.
-
-Articles:
-{chr(10).join(article_summaries)}
-
-Generate 6 focus options that are:
-1. Specific to the issues in these articles
-2. Relevant to Oklahoma constituents
-3. Actionable for government officials
-4. Clear and concise (10-15 words each)
-
-Format as a numbered list, one focus per line. Examples of good focus areas:
-- Impact on rural Oklahoma communities and farmers
-- Effects on working families' healthcare costs
-- Constitutional implications for civil liberties
-- Economic consequences for small businesses
-- Environmental impact on local water resources
-- Effects on veterans and military families
-
-Return ONLY the 6 numbered focus options, nothing else."""
-
-            response = self.drafter.client.chat.completions.create(
-                model=self.drafter.model,
-                messages=[
-                    {"role": "system", "content": "You are a policy analyst helping constituents identify key focus areas for their letters to officials."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=300
-            )
-
-            focus_text = response.choices[0].message.content.strip()
+            focus_text = self.drafter.suggest_focus_areas(articles).strip()
 
             # Parse the numbered list
             focus_options = []
             for line in focus_text.split('\n'):
-                line = line.strip()
-                if line and (line[0].isdigit() or line.startswith('-') or line.startswith('•')):
-                    # Remove number, dash, or bullet and clean up
-                    cleaned = line.lstrip('0123456789.-•').strip()
+                match = self._FOCUS_LINE_RE.match(line)
+                if match:
+                    cleaned = match.group(1).strip()
                     if cleaned:
                         focus_options.append(cleaned)
 
             # Ensure we have at least 6 options (add defaults if needed)
-            default_options = [
-                "Impact on rural Oklahoma communities",
-                "Economic effects on working families",
-                "Constitutional and democratic principles",
-                "Healthcare access and affordability",
-                "Education and workforce development",
-                "Infrastructure and public services"
-            ]
-
-            while len(focus_options) < 6:
-                if default_options:
-                    focus_options.append(default_options.pop(0))
+            focus_options.extend(self.DEFAULT_FOCUS_OPTIONS[:max(0, 6 - len(focus_options))])
 
             return focus_options[:6]  # Return only first 6
 
         except Exception as e:
             logger.warning(f"Could not generate AI focus options: {e}")
             # Return default options if AI fails
-            return [
-                "Impact on rural Oklahoma communities",
-                "Economic effects on working families",
-                "Constitutional and democratic principles",
-                "Healthcare access and affordability",
-                "Education and workforce development",
-                "Infrastructure and public services"
-            ]
+            return list(self.DEFAULT_FOCUS_OPTIONS)
 
     def select_tone_and_focus(self, articles: Optional[List[Dict]] = None) -> Tuple[str, str, str]:
         """Interactive selection of tone and focus"""
@@ -1458,14 +1888,7 @@ Return ONLY the 6 numbered focus options, nothing else."""
             print("Analyzing articles to suggest relevant focus areas...\n")
             focus_options = self.generate_focus_options(articles)
         else:
-            focus_options = [
-                "Impact on rural Oklahoma communities",
-                "Economic effects on working families",
-                "Constitutional and democratic principles",
-                "Healthcare access and affordability",
-                "Education and workforce development",
-                "Infrastructure and public services"
-            ]
+            focus_options = list(self.DEFAULT_FOCUS_OPTIONS)
 
         # Display numbered options
         for i, option in enumerate(focus_options, 1):
@@ -1495,14 +1918,8 @@ Return ONLY the 6 numbered focus options, nothing else."""
 
         return tone, focus, context
 
-    def select_recipients(self) -> List[Dict]:
-        """Select multiple officials and their specific office addresses"""
-        self.display_header("SELECT RECIPIENTS")
-
-        print("\n📮 Select officials to send letters to:")
-        print("   You can select multiple recipients.\n")
-
-        # Group unique officials by type (combine multiple offices per official)
+    def _build_officials_index(self) -> Tuple[List[Tuple[str, Dict]], Dict[str, List[Tuple[str, Dict]]]]:
+        """Group recipients into officials (all offices of one person) and officials by office type"""
         officials_data = {}  # official_id -> {info, offices}
 
         for recipient in self.json_generator.recipients:
@@ -1516,126 +1933,83 @@ Return ONLY the 6 numbered focus options, nothing else."""
 
             officials_data[official_id]['offices'].append(recipient)
 
-        # Group by type for display
-        federal_senate = []
-        federal_house = []
-        state_senate = []
-        state_house = []
-        governor = []
-
+        groups = {office_type: [] for office_type, _ in self.GROUP_ORDER}
         for official_id, data in officials_data.items():
+            # Resolve the Washington and in-state offices once, for the 'dc'/'local' shortcuts
+            dc_office = local_office = None
+            for office in data['offices']:
+                if dc_office is None and (office.get('office_location') == 'dc' or office['state'] == 'DC'):
+                    dc_office = office
+                if local_office is None and office['state'] == 'OK':
+                    local_office = office
+            data['dc_office'] = dc_office
+            data['local_office'] = local_office
+
+            # Menu line text (without its number), formatted once per index build
             info = data['info']
-            if info['office_type'] == 'federal_senate':
-                federal_senate.append((official_id, data))
-            elif info['office_type'] == 'federal_house':
-                federal_house.append((official_id, data))
-            elif info['office_type'] == 'state_senate':
-                state_senate.append((official_id, data))
-            elif info['office_type'] == 'state_house':
-                state_house.append((official_id, data))
-            elif info['office_type'] == 'governor':
-                governor.append((official_id, data))
-
-        # Display officials grouped by type
-        all_officials = []
-        idx = 1
+            offices_count = len(data['offices'])
+            district = f" - District {info.get('district')}" if info.get('district') else ""
+            office_text = f" ({offices_count} offices)" if offices_count > 1 else ""
+            data['display'] = f"{info['full_name']}{district}{office_text}"
 
-        if governor:
-            print("🏛️  GOVERNOR:")
-            for official_id, data in governor:
-                info = data['info']
-                offices_count = len(data['offices'])
-                district = f" - District {info.get('district')}" if info.get('district') else ""
-                office_text = f" ({offices_count} office{'s' if offices_count > 1 else ''})" if offices_count > 1 else ""
-                print(f"  {idx:2}. {info['full_name']}{district}{office_text}")
-                all_officials.append((official_id, data))
-                idx += 1
-            print()
+            group = groups.get(data['info']['office_type'])
+            if group is not None:
+                group.append((official_id, data))
 
-        if federal_senate:
-            print("🇺🇸 U.S. SENATORS:")
-            for official_id, data in federal_senate:
-                info = data['info']
-                offices_count = len(data['offices'])
-                office_text = f" ({offices_count} offices)" if offices_count > 1 else ""
-                print(f"  {idx:2}. {info['full_name']}{office_text}")
-                all_officials.append((official_id, data))
-                idx += 1
-            print()
+        # Menu numbering follows display order
+        all_officials = [entry for office_type, _ in self.GROUP_ORDER for entry in groups[office_type]]
+        return all_officials, groups
 
-        if federal_house:
-            print("🏛️  U.S. REPRESENTATIVES:")
-            for official_id, data in federal_house:
-                info = data['info']
-                offices_count = len(data['offices'])
-                district = f" - District {info.get('district')}" if info.get('district') else ""
-                office_text = f" ({offices_count} offices)" if offices_count > 1 else ""
-                print(f"  {idx:2}. {info['full_name']}{district}{office_text}")
-                all_officials.append((official_id, data))
-                idx += 1
-            print()
+    def select_recipients(self) -> List[Dict]:
+        """Select multiple officials and their specific office addresses"""
+        self.display_header("SELECT RECIPIENTS")
 
-        if state_senate:
-            print("🏛️  STATE SENATORS:")
-            for official_id, data in state_senate:
-                info = data['info']
-                offices_count = len(data['offices'])
-                district = f" - District {info.get('district')}" if info.get('district') else ""
-                office_text = f" ({offices_count} office{'s' if offices_count > 1 else ''})" if offices_count > 1 else ""
-                print(f"  {idx:2}. {info['full_name']}{district}{office_text}")
-                all_officials.append((official_id, data))
-                idx += 1
-            print()
+        # Officials grouped by type, rebuilt only when the recipient list changes
+        recipients = self.json_generator.recipients
+        if self._officials_cache is None or self._officials_cache[0] is not recipients:
+            self._officials_cache = (recipients, self._build_officials_index())
+        all_officials, groups = self._officials_cache[1]
 
-        if state_house:
-            print("🏛️  STATE REPRESENTATIVES:")
-            for official_id, data in state_house:
-                info = data['info']
-                offices_count = len(data['offices'])
-                district = f" - District {info.get('district')}" if info.get('district') else ""
-                office_text = f" ({offices_count} office{'s' if offices_count > 1 else ''})" if offices_count > 1 else ""
-                print(f"  {idx:2}. {info['full_name']}{district}{office_text}")
-                all_officials.append((official_id, data))
+        # Display officials grouped by type; the whole menu is collected and
+        # written at once rather than line by line
+        blocks = []
+        idx = 1
+        for office_type, heading in self.GROUP_ORDER:
+            if not groups[office_type]:
+                continue
+            lines = [f"{heading}\n"]
+            for official_id, data in groups[office_type]:
+                lines.append(f"  {idx:2}. {data['display']}\n")
                 idx += 1
+            blocks.append("".join(lines))
+
+        parts = ["\n📮 Select officials to send letters to:\n",
+                 "   You can select multiple recipients.\n\n",
+                 "\n".join(blocks)]
 
         # Get user selections
-        print("\n📋 Enter recipient numbers separated by commas (e.g., 1,3,5)")
-        print("   Or enter 'all' to select all recipients")
-        print("   Or enter 'federal' for all federal officials")
-        print("   Or enter 'state' for all state officials")
-        print("   Or enter 'federal-dc' for federal officials (DC offices)")
-        print("   Or enter 'federal-local' for federal officials (local offices)")
-        print("   Or enter 'state-local' for state officials (local offices)")
+        parts.append("\n📋 Enter recipient numbers separated by commas (e.g., 1,3,5)\n")
+        parts.append("   Or enter 'all' to select all recipients\n")
+        parts.append("   Or enter 'federal' for all federal officials\n")
+        parts.append("   Or enter 'state' for all state officials\n")
+        parts.append("   Or enter 'federal-dc' for federal officials (DC offices)\n")
+        parts.append("   Or enter 'federal-local' for federal officials (local offices)\n")
+        parts.append("   Or enter 'state-local' for state officials (local offices)\n")
+        sys.stdout.write("".join(parts))
 
         while True:
-            selection = input("\nYour selection: ").strip().lower()
+            selection = self._prompt_choice("\nYour selection: ")
 
             selected_officials = []
             preset_office_choice = None  # Will be 'dc' or 'local' for batch office selection
 
-            if selection == 'all':
-                selected_officials = all_officials.copy()
-            elif selection == 'federal':
-                selected_officials = [(oid, data) for oid, data in all_officials
-                                     if data['info']['office_type'] in ['federal_senate', 'federal_house']]
-            elif selection == 'state':
-                selected_officials = [(oid, data) for oid, data in all_officials
-                                     if data['info']['office_type'] in ['state_senate', 'state_house', 'governor']]
-            elif selection == 'federal-dc':
-                selected_officials = [(oid, data) for oid, data in all_officials
-                                     if data['info']['office_type'] in ['federal_senate', 'federal_house']]
-                preset_office_choice = 'dc'
-                print("✓ Selecting federal officials with DC offices...")
-            elif selection == 'federal-local':
+            preset = self.SELECTION_PRESETS.get(selection)
+            if preset:
+                office_types, preset_office_choice, message = preset
                 selected_officials = [(oid, data) for oid, data in all_officials
-                                     if data['info']['office_type'] in ['federal_senate', 'federal_house']]
-                preset_office_choice = 'local'
-                print("✓ Selecting federal officials with local offices...")
-            elif selection == 'state-local':
-                selected_officials = [(oid, data) for oid, data in all_officials
-                                     if data['info']['office_type'] in ['state_senate', 'state_house', 'governor']]
-                preset_office_choice = 'local'
-                print("✓ Selecting state officials with local offices...")
+                                      if office_types is None or data['info']['office_type'] in office_types]
+                if message:
+                    print(message)
             else:
                 # Parse comma-separated numbers
                 try:
@@ -1662,12 +2036,14 @@ Return ONLY the 6 numbered focus options, nothing else."""
                 if preset_office_choice:
                     batch_choice = '1' if preset_office_choice == 'dc' else '2'
                 elif has_multi_office:
-                    print("\n📍 Office Selection:")
-                    print("   Some officials have multiple offices.")
-                    print("   Choose how to proceed:")
-                    print("   1. Select DC offices for all (where available)")
-                    print("   2. Select local/state offices for all (where available)")
-                    print("   3. Choose individually for each official")
+                    sys.stdout.write(
+                        "\n📍 Office Selection:\n"
+                        "   Some officials have multiple offices.\n"
+                        "   Choose how to proceed:\n"
+                        "   1. Select DC offices for all (where available)\n"
+                        "   2. Select local/state offices for all (where available)\n"
+                        "   3. Choose individually for each official\n"
+                    )
 
                     batch_choice = input("\nYour choice (1-3, default 3): ").strip() or '3'
                 else:
@@ -1677,14 +2053,8 @@ Return ONLY the 6 numbered focus options, nothing else."""
                     # Select DC offices where available
                     print("\n✓ Selecting DC offices where available...")
                     for official_id, data in selected_officials:
-                        offices = data['offices']
-                        dc_office = None
-                        for office in offices:
-                            if office.get('office_location') == 'dc' or office['state'] == 'DC':
-                                dc_office = office
-                                break
                         # Use DC office if available, otherwise first office
-                        selected = dc_office if dc_office else offices[0]
+                        selected = data['dc_office'] or data['offices'][0]
                         final_recipients.append(selected)
                         print(f"   • {selected['full_name']}: {selected.get('office_name', selected['city'])}")
 
@@ -1692,14 +2062,8 @@ Return ONLY the 6 numbered focus options, nothing else."""
                     # Select local offices where available
                     print("\n✓ Selecting local offices where available...")
                     for official_id, data in selected_officials:
-                        offices = data['offices']
-                        local_office = None
-                        for office in offices:
-                            if office['state'] == 'OK':
-                                local_office = office
-                                break
                         # Use local office if available, otherwise first office
-                        selected = local_office if local_office else offices[0]
+                        selected = data['local_office'] or data['offices'][0]
                         final_recipients.append(selected)
                         print(f"   • {selected['full_name']}: {selected.get('office_name', selected['city'])}")
 
@@ -1723,30 +2087,23 @@ Return ONLY the 6 numbered focus options, nothing else."""
                                 print(f"     {office['street_1']}, {office['city']}, {office['state']}")
 
                             # Check if this official has DC and local offices
-                            has_dc = any(o.get('office_location') == 'dc' or o['state'] == 'DC'
-                                        for o in offices)
-                            has_local = any(o['state'] == 'OK' for o in offices)
+                            has_dc = data['dc_office'] is not None
+                            has_local = data['local_office'] is not None
 
                             if has_dc and has_local:
                                 print(f"\n   Or type 'dc' for Washington office")
                                 print(f"   Or type 'local' for Oklahoma office")
 
                             while True:
-                                choice = input(f"\nSelect office (1-{len(offices)}): ").strip().lower()
+                                choice = self._prompt_choice(f"\nSelect office (1-{len(offices)}): ")
 
                                 selected_office = None
 
                                 # Check for DC/local shortcuts
                                 if choice == 'dc' and has_dc:
-                                    for office in offices:
-                                        if office.get('office_location') == 'dc' or office['state'] == 'DC':
-                                            selected_office = office
-                                            break
+                                    selected_office = data['dc_office']
                                 elif choice == 'local' and has_local:
-                                    for office in offices:
-                                        if office['state'] == 'OK':
-                                            selected_office = office
-                                            break
+                                    selected_office = data['local_office']
                                 else:
                                     # Try numeric selection
                                     try:
@@ -1767,13 +2124,14 @@ Return ONLY the 6 numbered focus options, nothing else."""
                     for official_id, data in selected_officials:
                         final_recipients.append(data['offices'][0])
 
-                print(f"\n📊 Final Selection Summary:")
-                print(f"   {len(final_recipients)} recipient(s) with specific offices:")
+                summary = [f"\n📊 Final Selection Summary:\n",
+                           f"   {len(final_recipients)} recipient(s) with specific offices:\n"]
                 for r in final_recipients:
                     office_name = r.get('office_name', f"{r['city']} Office")
-                    print(f"   • {r['full_name']} - {office_name}")
+                    summary.append(f"   • {r['full_name']} - {office_name}\n")
+                sys.stdout.write("".join(summary))
 
-                confirm = input("\nConfirm selection? (y/n): ").strip().lower()
+                confirm = self._prompt_choice("\nConfirm selection? (y/n): ")
                 if confirm == 'y':
                     return final_recipients
             else:
@@ -1819,14 +2177,14 @@ Return ONLY the 6 numbered focus options, nothing else."""
             recipient=recipient
         )
 
-        self.session_data['drafts'].append({
+        self._log_event('drafts', {
             'version': len(self.session_data['drafts']) + 1,
             'subject': subject,
             'letter': letter,
             'tone': tone,
             'focus': focus,
             'context': context,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time_ns()
         })
 
         print("✓ Letter drafted successfully!")
@@ -1834,29 +2192,30 @@ Return ONLY the 6 numbered focus options, nothing else."""
 
         return subject, letter
 
+    def _editor_file(self) -> Path:
+        """Scratch file handed to the editor, created on first use and removed at exit"""
+        if self._edit_file is None:
+            import tempfile
+
+            edit_dir = tempfile.mkdtemp(prefix='ai_writer_')
+            atexit.register(shutil.rmtree, edit_dir, True)
+            self._edit_file = Path(edit_dir) / 'letter.txt'
+        return self._edit_file
+
     def open_in_editor(self, content: str) -> str:
         """Open content in visual editor"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            temp_file = f.name
+        import subprocess
 
-        try:
-            print(f"\n📝 Opening in {self.editor}...")
-            print("   (Save and exit when done)")
-            time.sleep(1)
+        # The same scratch file is reused for every edit in the session
+        edit_file = self._editor_file()
+        edit_file.write_text(content, encoding='utf-8')
 
-            subprocess.call([self.editor, temp_file])
+        print(f"\n📝 Opening in {self.editor}...")
+        print("   (Save and exit when done)")
 
-            with open(temp_file, 'r') as f:
-                edited_content = f.read()
+        subprocess.call([self.editor, str(edit_file)])
 
-            return edited_content
-
-        finally:
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
+        return edit_file.read_text(encoding='utf-8')
 
     def review_and_edit_loop(self, subject: str, letter: str, articles: List[Dict],
                             tone: str, focus: str, context: str, recipient: Dict,
@@ -1873,56 +2232,54 @@ Return ONLY the 6 numbered focus options, nothing else."""
                 print(f"📍 OFFICE: {office_name}")
 
             print(f"\n📧 SUBJECT: {subject}\n")
-            print("-" * 70)
+            print(_SEPARATOR)
             print(letter)
-            print("-" * 70)
+            print(_SEPARATOR)
+
+            # Number the options on screen; comparing only applies to a personalized letter
+            can_compare = bool(base_letter and base_letter != letter)
+            options = [(action, label) for action, label in self.REVIEW_OPTIONS
+                       if action != 'compare' or can_compare]
+            menu = {str(number): action for number, (action, _) in enumerate(options, 1)}
 
             print("\n🔧 OPTIONS:")
-            print("  1. Accept and generate mailer JSON")
-            print("  2. Edit in visual editor")
-            print("  3. Request AI revision")
-            print("  4. Regenerate with different tone/focus")
-            print("  5. View source articles")
-            if base_letter and base_letter != letter:
-                print("  6. Compare with base letter")
-                print("  7. Save draft and exit")
-                print("  8. Discard and exit")
-            else:
-                print("  6. Save draft and exit")
-                print("  7. Discard and exit")
+            for number, (_, label) in enumerate(options, 1):
+                print(f"  {number}. {label}")
 
-            max_choice = '8' if (base_letter and base_letter != letter) else '7'
-            choice = input(f"\nYour choice (1-{max_choice}): ").strip()
+            choice = input(f"\nYour choice (1-{len(options)}): ").strip()
+            action = menu.get(choice)
 
-            if choice == '1':
+            if action == 'accept':
                 self.session_data['final_letter'] = {
                     'subject': subject,
                     'letter': letter,
-                    'accepted_at': datetime.now().isoformat()
+                    'accepted_at': self._now()
                 }
+                self._session_dirty = True
                 return subject, letter
 
-            elif choice == '2':
+            elif action == 'edit':
                 print("\n📝 Opening letter in editor...")
                 edit_content = f"SUBJECT: {subject}\n\n{letter}"
                 edited = self.open_in_editor(edit_content)
 
-                lines = edited.split('\n')
-                if lines[0].startswith('SUBJECT:'):
-                    subject = lines[0].replace('SUBJECT:', '').strip()
-                    letter = '\n'.join(lines[2:]).strip()
+                # SUBJECT line, a blank line, then the letter body
+                first_line, _, rest = edited.partition('\n')
+                if first_line.startswith('SUBJECT:'):
+                    subject = first_line.replace('SUBJECT:', '').strip()
+                    letter = rest.partition('\n')[2].strip()
                 else:
                     letter = edited.strip()
 
-                self.session_data['user_edits'].append({
-                    'timestamp': datetime.now().isoformat(),
+                self._log_event('user_edits', {
+                    'timestamp': time.time_ns(),
                     'type': 'visual_editor'
                 })
 
                 print("\n✓ Letter updated")
                 input("Press Enter to continue...")
 
-            elif choice == '3':
+            elif action == 'revise':
                 print("\n💬 What would you like to change?")
                 feedback = input("Your feedback: ").strip()
 
@@ -1930,18 +2287,18 @@ Return ONLY the 6 numbered focus options, nothing else."""
                     print("\n🤖 Revising letter...")
                     revised_letter = self.drafter.refine_letter(letter, feedback)
 
-                    self.session_data['revisions'].append({
+                    self._log_event('revisions', {
                         'feedback': feedback,
                         'original': letter,
                         'revised': revised_letter,
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': time.time_ns()
                     })
 
                     letter = revised_letter
                     print("✓ Letter revised!")
                     input("Press Enter to continue...")
 
-            elif choice == '4':
+            elif action == 'regenerate':
                 print("\n🔄 Let's regenerate...")
                 new_tone, new_focus, new_context = self.select_tone_and_focus(articles)
 
@@ -1960,14 +2317,14 @@ Return ONLY the 6 numbered focus options, nothing else."""
                     recipient=recipient
                 )
 
-                self.session_data['drafts'].append({
+                self._log_event('drafts', {
                     'version': len(self.session_data['drafts']) + 1,
                     'subject': new_subject,
                     'letter': new_letter,
                     'tone': new_tone,
                     'focus': new_focus,
                     'context': new_context,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': time.time_ns()
                 })
 
                 subject = new_subject
@@ -1975,9 +2332,9 @@ Return ONLY the 6 numbered focus options, nothing else."""
                 print("✓ Letter regenerated!")
                 input("Press Enter to continue...")
 
-            elif choice == '5':
+            elif action == 'articles':
                 print("\n📰 SOURCE ARTICLES:")
-                print("-" * 70)
+                print(_SEPARATOR)
                 for i, article in enumerate(articles, 1):
                     print(f"\n{i}. {article['title']}")
                     print(f"   Source: {article['source']}")
@@ -1985,36 +2342,26 @@ Return ONLY the 6 numbered focus options, nothing else."""
 
                 input("\nPress Enter to return...")
 
-            elif choice == '6' and base_letter and base_letter != letter:
+            elif action == 'compare':
                 # Compare with base letter
                 print("\n📊 LETTER COMPARISON:")
-                print("-" * 70)
+                print(_SEPARATOR)
                 print("\n🔵 BASE LETTER (template):")
-                print("-" * 35)
-                print(base_letter[:500] + "..." if len(base_letter) > 500 else base_letter)
+                print(_HALF_SEPARATOR)
+                print(f"{base_letter[:500]}..." if len(base_letter) > 500 else base_letter)
                 print("\n🔶 PERSONALIZED LETTER (current):")
-                print("-" * 35)
-                print(letter[:500] + "..." if len(letter) > 500 else letter)
-                print("-" * 70)
+                print(_HALF_SEPARATOR)
+                print(f"{letter[:500]}..." if len(letter) > 500 else letter)
+                print(_SEPARATOR)
                 input("\nPress Enter to return...")
 
-            elif choice == '6' and not (base_letter and base_letter != letter):
+            elif action == 'save':
                 self.save_session()
                 print("\n✓ Draft saved")
                 return None, None
 
-            elif choice == '7' and not (base_letter and base_letter != letter):
-                confirm = input("\n⚠️  Discard all changes? (yes/no): ").strip().lower()
-                if confirm == 'yes':
-                    return None, None
-
-            elif choice == '7' and base_letter and base_letter != letter:
-                self.save_session()
-                print("\n✓ Draft saved")
-                return None, None
-
-            elif choice == '8' and base_letter and base_letter != letter:
-                confirm = input("\n⚠️  Discard all changes? (yes/no): ").strip().lower()
+            elif action == 'discard':
+                confirm = self._prompt_choice("\n⚠️  Discard all changes? (yes/no): ")
                 if confirm == 'yes':
                     return None, None
 
@@ -2037,55 +2384,121 @@ Return ONLY the 6 numbered focus options, nothing else."""
 
         # Store in session
         self.session_data['mailer_json'] = mailer_json
+        self._session_dirty = True
 
         print("✓ JSON generated successfully!")
         return mailer_json
 
     def save_outputs(self, mailer_json: Dict, subject: str, letter: str):
         """Save all output files"""
-        output_dir = f"mailer_output/{self.session_id}"
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        output_dir = self._session_dir()
 
         # Generate filename based on recipient
         recipient = self.json_generator.current_recipient
         if recipient:
-            recipient_name = recipient.get('name', 'official').lower().replace(' ', '_')
+            recipient_name = _slugify(recipient.get('name', 'official'))
             json_filename = f"letter_to_{recipient_name}.json"
         else:
             json_filename = "letter_to_official.json"
 
-        # Save mailer JSON
-        json_file = f"{output_dir}/{json_filename}"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(mailer_json, f, indent=2, ensure_ascii=False)
-        self.session_data['output_files'].append(json_file)
+        json_file = output_dir / json_filename
+        text_file = output_dir / 'letter_plain.txt'
+        session_file = output_dir / 'session.data'
 
-        # Save plain text letter
-        text_file = f"{output_dir}/letter_plain.txt"
-        with open(text_file, 'w', encoding='utf-8') as f:
-            f.write(f"SUBJECT: {subject}\n\n{letter}")
-        self.session_data['output_files'].append(text_file)
+        # Encode all three files up front, then write them back to back. The
+        # session snapshot lists the letter files but not itself, as before.
+        json_payload = _json_dumps(mailer_json)
+        text_payload = f"SUBJECT: {subject}\n\n{letter}".encode('utf-8')
+        self.session_data['output_files'].extend([str(json_file), str(text_file)])
+        session_payload = _json_dumps(self._format_session())
 
-        # Save session data
-        session_file = f"{output_dir}/session.data"
-        with open(session_file, 'w', encoding='utf-8') as f:
-            json.dump(self.session_data, f, indent=2, ensure_ascii=False)
-        self.session_data['output_files'].append(session_file)
+        _write_bytes(json_file, json_payload)
+        _write_bytes(text_file, text_payload)
+        _replace_bytes(session_file, session_payload)
+        self.session_data['output_files'].append(str(session_file))
+        self._session_dirty = True
 
         print(f"\n📁 Files saved to: {output_dir}/")
         print(f"   • {json_filename} - Ready for mailer PDF generation")
         print(f"   • letter_plain.txt - Plain text version")
         print(f"   • session.data - Complete session history")
 
-        return output_dir
-
-    def save_session(self):
-        """Save session data"""
-        session_file = f"session_{self.session_id}.data"
-        self.session_data['end_time'] = datetime.now().isoformat()
-
-        with open(session_file, 'w', encoding='utf-8') as f:
-            json.dump(self.session_data, f, indent=2, ensure_ascii=False)
+        return str(output_dir)
+
+    @staticmethod
+    def _report_drafted(recipient: Dict):
+        """Progress line for a letter drafted in a background batch"""
+        sys.stdout.write(f"   ✓ Drafted: {recipient['full_name']}\n")
+
+    def _session_dir(self) -> Path:
+        """This session's output directory, created when the first letters are about to be written"""
+        if not self._output_dir_created:
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dir_created = True
+            self._move_session_log(self._output_dir / 'session.jsonl')
+        return self._output_dir
+
+    def _pending_log_path(self) -> Path:
+        """Where the JSONL history is kept until the session has an output directory"""
+        return Path(f"session_{self.session_id}.jsonl")
+
+    def _move_session_log(self, target: Path):
+        """Move the JSONL history written so far to target; later events are appended there"""
+        self._close_session_log()
+        pending = self._pending_log_path()
+        try:
+            if pending.exists():
+                os.replace(pending, target)
+        except OSError as e:
+            logger.warning(f"Could not move session log: {e}")
+        self._session_log_path = target
+
+    def _close_session_log(self):
+        """Close the JSONL history file; the next logged event reopens it for appending"""
+        if self._session_log is not None:
+            self._session_log.close()
+            self._session_log = None
+
+    def _log_event(self, kind: str, event: Dict):
+        """Record a session event and append it to the session's JSONL history"""
+        self.session_data[kind].append(event)
+        self._session_dirty = True
+
+        # One line per event, so the history on disk grows without rewriting it
+        try:
+            if self._session_log is None:
+                path = self._session_log_path or self._pending_log_path()
+                self._session_log = open(path, 'ab', buffering=0)
+            self._session_log.write(_json_line(
+                dict(event, event=kind, timestamp=_iso_from_ns(event['timestamp']))
+            ))
+        except OSError as e:
+            logger.warning(f"Could not write session log: {e}")
+
+    def _format_session(self) -> Dict:
+        """Session data ready to save, with event timestamps (epoch ns) rendered as ISO strings"""
+        data = dict(self.session_data)
+        for key in self.TIMESTAMPED_EVENTS:
+            data[key] = [
+                dict(event, timestamp=_iso_from_ns(event['timestamp']))
+                for event in data[key]
+            ]
+        return data
+
+    def save_session(self, path: Optional[str] = None):
+        """Save session data (by default to session_<id>.data, or wherever run() has pointed it)"""
+        session_file = path or self._session_file or f"session_{self.session_id}.data"
+        self._close_session_log()
+
+        # Skipped when nothing was recorded since the last save to this same file (e.g.
+        # "save draft" followed by the end-of-run save), as it is already current
+        if self._session_dirty or session_file != self._session_saved_to:
+            # The session ends at its first save; later saves only add what followed it
+            if 'end_time' not in self.session_data:
+                self.session_data['end_time'] = self._now()
+            _replace_bytes(session_file, _json_dumps(self._format_session()))
+            self._session_dirty = False
+            self._session_saved_to = session_file
 
         print(f"📁 Session saved to: {session_file}")
 
@@ -2106,6 +2519,7 @@ Return ONLY the 6 numbered focus options, nothing else."""
             # Step 1: Select recipients (multiple)
             recipients = self.select_recipients()
             self.session_data['recipients'] = recipients
+            self._session_dirty = True
 
             # Step 2: Collect news articles
             urls = self.collect_news_articles()
@@ -2124,6 +2538,7 @@ Return ONLY the 6 numbered focus options, nothing else."""
             # Step 6: Detect category
             category = self.detect_topic_category(articles, letter)
             self.session_data['category'] = category
+            self._session_dirty = True
 
             # Step 7: Review and edit base letter
             print(f"\n📝 Drafting base letter for {first_recipient['name']}...")
@@ -2146,23 +2561,62 @@ Return ONLY the 6 numbered focus options, nothing else."""
                     print("\n🔍 Review Options:")
                     print("   Would you like to review and edit each personalized letter?")
                     print("   (If no, all letters will be generated automatically)")
-                    review_each = input("\n   Review each letter? (y/n, default n): ").strip().lower() or 'n'
-
-                generated_letters = []
-                output_dir = f"mailer_output/{self.session_id}"
-                Path(output_dir).mkdir(parents=True, exist_ok=True)
-
+                    review_each = self._prompt_choice("\n   Review each letter? (y/n, default n): ") or 'n'
+
+                generated_letters = self.session_data['generated_letters']
+                # Plain string paths from here on; the directory is created at most once per session
+                output_dir = str(self._session_dir())
+                # From here on every session save (end of run, Ctrl-C or error) goes next to
+                # the letters, so an interrupted batch isn't split across two directories
+                self._session_file = f"{output_dir}/session.data"
+
+                # Letters that won't be reviewed are independent API calls, so draft them
+                # all up front and concurrently; variation index -> (subject, letter)
+                prefetched = {}
+                if review_each != 'y' and len(recipients) > 1:
+                    print(f"\n🤖 Generating {len(recipients) - 1} personalized versions (Ctrl-C to stop)...")
+                    prefetched = dict(enumerate(self.drafter.personalize_letters_batch(
+                        base_letter=final_letter,
+                        base_subject=final_subject,
+                        recipients=recipients[1:],
+                        articles=articles,
+                        tone=tone,
+                        focus=focus,
+                        start_index=2,
+                        on_done=self._report_drafted
+                    ), 2))
+
+                # Filename templates and the directory prefix, filled in per recipient
+                json_name = "letter_to_{}.json".format
+                text_name = "letter_to_{}.txt".format
+                output_prefix = output_dir + "/"
+
+                output_files = []
+                total = len(recipients)
                 for i, recipient in enumerate(recipients, 1):
-                    print(f"\n{i}/{len(recipients)} - {recipient['full_name']}...")
-
-                    # Set current recipient
-                    self.json_generator.set_recipient(recipient)
+                    full_name = recipient['full_name']
+                    slug = _slugify(recipient.get('name', 'official'))
+                    json_filename = json_name(slug)
+                    text_filename = text_name(slug)
+
+                    # Letters already in hand get their progress line and result in one write;
+                    # the rest show the progress line now, before drafting or review
+                    progress = f"\n{i}/{total} - {full_name}...\n"
+                    if i != 1 and i not in prefetched:
+                        sys.stdout.write(progress)
+                        progress = ""
+
+                    # Set current recipient (the first was already set for the base letter)
+                    if i != 1:
+                        self.json_generator.set_recipient(recipient)
 
                     # Generate personalized version if not the first recipient
                     if i == 1:
                         # Use the reviewed letter for first recipient
                         personalized_subject = final_subject
                         personalized_letter = final_letter
+                    elif i in prefetched:
+                        personalized_subject, personalized_letter = prefetched.pop(i)
                     else:
                         # Create unique variation for other recipients
                         print(f"   🤖 Generating personalized version...")
@@ -2178,12 +2632,12 @@ Return ONLY the 6 numbered focus options, nothing else."""
 
                         # Allow review and editing if requested
                         if review_each == 'y':
-                            print(f"\n📝 Review letter for {recipient['full_name']}")
+                            print(f"\n📝 Review letter for {full_name}")
                             print(f"   Office: {recipient.get('office_name', recipient['city'])}")
 
                             # If there are more recipients, offer option to skip remaining reviews
-                            if i < len(recipients):
-                                print(f"   ({len(recipients) - i} more letters remaining)")
+                            if i < total:
+                                print(f"   ({total - i} more letters remaining)")
                                 print("\n   Options:")
                                 print("   1. Review this letter")
                                 print("   2. Accept this letter and all remaining without review")
@@ -2195,6 +2649,17 @@ Return ONLY the 6 numbered focus options, nothing else."""
                                     # Accept all remaining without review
                                     review_each = 'n'
                                     print("   ✓ Accepting this and all remaining letters without review")
+                                    print(f"   🤖 Generating {total - i} personalized versions (Ctrl-C to stop)...")
+                                    prefetched = dict(enumerate(self.drafter.personalize_letters_batch(
+                                        base_letter=final_letter,
+                                        base_subject=final_subject,
+                                        recipients=recipients[i:],
+                                        articles=articles,
+                                        tone=tone,
+                                        focus=focus,
+                                        start_index=i + 1,
+                                        on_done=self._report_drafted
+                                    ), i + 1))
                                 elif review_choice == '3':
                                     # Just accept this one
                                     print("   ✓ Accepting this letter without review")
@@ -2219,62 +2684,60 @@ Return ONLY the 6 numbered focus options, nothing else."""
                     )
 
                     # Save letter files
-                    recipient_name_lower = recipient.get('name', 'official').lower().replace(' ', '_')
-                    json_filename = f"letter_to_{recipient_name_lower}.json"
-                    json_file = f"{output_dir}/{json_filename}"
-
-                    with open(json_file, 'w', encoding='utf-8') as f:
-                        json.dump(mailer_json, f, indent=2, ensure_ascii=False)
+                    json_path = output_prefix + json_filename
+                    _write_bytes(json_path, _json_dumps(mailer_json))
+                    output_files.append(json_path)
 
                     # Save plain text version too
-                    text_file = f"{output_dir}/letter_to_{recipient_name_lower}.txt"
-                    with open(text_file, 'w', encoding='utf-8') as f:
-                        f.write(f"TO: {recipient['full_name']}\n")
-                        f.write(f"TITLE: {recipient['title']}\n")
-                        f.write(f"SUBJECT: {personalized_subject}\n\n")
-                        f.write(personalized_letter)
-
-                    generated_letters.append({
-                        'recipient': recipient,
+                    _write_bytes(output_prefix + text_filename, (
+                        f"TO: {full_name}\n"
+                        f"TITLE: {recipient['title']}\n"
+                        f"SUBJECT: {personalized_subject}\n\n"
+                        f"{personalized_letter}"
+                    ).encode('utf-8'))
+
+                    # Logged as it happens, so an interrupted batch still records what was written.
+                    # The full recipient record is already in session_data['recipients'].
+                    self._log_event('generated_letters', {
+                        'recipient_id': recipient.get('id'),
+                        'full_name': full_name,
                         'subject': personalized_subject,
                         'json_file': json_filename,
-                        'text_file': f"letter_to_{recipient_name_lower}.txt"
+                        'text_file': text_filename,
+                        'timestamp': time.time_ns()
                     })
 
-                    print(f"   ✓ Generated: {json_filename}")
-
-                # Save session data with all letters
-                self.session_data['generated_letters'] = generated_letters
-                self.session_data['output_files'] = [f"{output_dir}/{g['json_file']}" for g in generated_letters]
+                    sys.stdout.write(f"{progress}   ✓ Generated: {json_filename}\n")
 
-                session_file = f"{output_dir}/session.data"
-                with open(session_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.session_data, f, indent=2, ensure_ascii=False)
+                # Session data with all letters is saved once, to the output directory,
+                # by the save_session() call below
+                self.session_data['output_files'] = output_files
+                self._session_dirty = True
 
                 # Final screen
                 self.display_header("ALL LETTERS GENERATED!")
 
-                print(f"\n✅ SUCCESS! Generated {len(generated_letters)} personalized letters!")
-                print(f"\n📊 Session Summary:")
-                print(f"  • Recipients: {len(recipients)}")
-                print(f"  • Articles analyzed: {len(articles)}")
-                print(f"  • Category: {category}")
-                print(f"  • Output directory: {output_dir}")
-
-                print(f"\n📄 Generated Letters:")
+                summary = [f"\n✅ SUCCESS! Generated {len(generated_letters)} personalized letters!\n",
+                           f"\n📊 Session Summary:\n",
+                           f"  • Recipients: {len(recipients)}\n",
+                           f"  • Articles analyzed: {len(articles)}\n",
+                           f"  • Category: {category}\n",
+                           f"  • Output directory: {output_dir}\n",
+                           f"\n📄 Generated Letters:\n"]
                 for gl in generated_letters:
-                    print(f"  • {gl['recipient']['full_name']}")
-                    print(f"    - {gl['json_file']}")
-
-                print(f"\n🚀 Next Steps:")
-                print(f"  1. Navigate to the mailer project:")
-                print(f"     cd ../mailer")
-                print(f"  2. Generate PDFs for all letters:")
-                print(f"     for json in ../markwayne/{output_dir}/*.json; do")
-                print(f"       python mailer.py \"$json\"")
-                print(f"     done")
-                print(f"  3. Review the generated PDFs")
-                print(f"  4. Print and mail to recipients")
+                    summary.append(f"  • {gl['full_name']}\n    - {gl['json_file']}\n")
+                summary.append(
+                    f"\n🚀 Next Steps:\n"
+                    f"  1. Navigate to the mailer project:\n"
+                    f"     cd ../mailer\n"
+                    f"  2. Generate PDFs for all letters:\n"
+                    f"     for json in ../markwayne/{output_dir}/*.json; do\n"
+                    f"       python mailer.py \"$json\"\n"
+                    f"     done\n"
+                    f"  3. Review the generated PDFs\n"
+                    f"  4. Print and mail to recipients\n"
+                )
+                sys.stdout.write("".join(summary))
 
             else:
                 print("\n❌ Letter generation cancelled")